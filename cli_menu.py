@@ -9,6 +9,8 @@ import os
 import random
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 
 import constants as cv
 import listen_history
@@ -21,17 +23,34 @@ import song_metadata
 import youtube_integration
 import youtube_utils
 
+# GNU readline gives every input() prompt C-level line editing and
+# up-arrow history; it is not shipped with CPython on Windows.
+try:
+    import readline
+except ImportError:
+    readline = None
+else:
+    readline.set_history_length(1000)
+
 # Track last played song for replay function
 _last_played_uid = None
 
+# Last "now playing" status line and the (timeline, library) versions it reflects
+_status_key = None
+_status_line = None
 
-def _try_num_command(arg, name, handler):
-    """Parse a numeric argument and invoke *handler*, or print an error."""
-    try:
-        num = int(arg.strip())
-        handler(num)
-    except ValueError:
+# Ad-hoc queue input: 2+ song numbers separated by commas and/or spaces
+_ADHOC_QUEUE_RE = re.compile(r"^[\s,]*\d+(?:[\s,]+\d+)+[\s,]*$")
+_NUMBER_RE = re.compile(r"\d+")
+
+
+def _try_num_command(arg, name, handler, songs):
+    """Parse a numeric argument and invoke ``handler(num, songs)``, or print an error."""
+    arg = arg.strip()
+    if not arg.isdecimal():
         print(f"Invalid {name} command. Usage: {name} <number>")
+        return
+    handler(int(arg), songs)
 
 
 def _handle_input_fallback(user_input, songs):
@@ -51,86 +70,95 @@ def _handle_input_fallback(user_input, songs):
         return True
 
     # Ad-hoc queue: 2+ numbers separated by commas/spaces
-    tokens = user_input.replace(",", " ").split()
-    if len(tokens) >= 2 and all(t.isdigit() for t in tokens):
-        _handle_adhoc_queue(tokens, songs)
+    if _ADHOC_QUEUE_RE.match(user_input):
+        _handle_adhoc_queue(_NUMBER_RE.findall(user_input), songs)
         return True
 
     # Plain number → play that song, anything else → search
     limit, query = _parse_search_limit(user_input)
-    try:
-        choice = int(query)
-        _handle_song_selection(str(choice), songs)
+    if query.isdecimal():
+        _handle_song_selection(query, songs)
         return True
-    except ValueError:
-        _handle_search(query, songs, limit)
-        return False
-
-
-def _dispatch_command(user_input, songs):
+    _handle_search(query, songs, limit)
+    return False
+
+
+# Exact-match commands: cmd -> (handler(cmd, songs), refresh)
+_EXACT_COMMANDS = {
+    "h": (lambda cmd, songs: _show_help(), False),
+    "help": (lambda cmd, songs: _show_help(), False),
+    "r": (lambda cmd, songs: _handle_replay(), True),
+    "p": (lambda cmd, songs: _playlist_menu(), True),
+    "t": (lambda cmd, songs: _display_timeline(), False),
+    "shuffle": (lambda cmd, songs: _handle_shuffle_all(songs), True),
+    "sh": (lambda cmd, songs: _handle_shuffle_all(songs), True),
+    "rand": (lambda cmd, songs: _handle_random_offer(cmd, songs), True),
+    "date": (lambda cmd, songs: _display_by_date(songs, reverse=False), False),
+    "date r": (lambda cmd, songs: _display_by_date(songs, reverse=True), False),
+    "top": (lambda cmd, songs: _display_by_play_count(cmd), False),
+    "--update-ytdlp": (lambda cmd, songs: _handle_update_ytdlp(), False),
+}
+
+# Commands that take an argument, keyed by their first word:
+# word -> (handler(arg, cmd, songs), refresh), where *arg* keeps its original case.
+# A handler returning False declines the argument, and the input is handled
+# as plain text (URL / number / search) instead
+_PREFIX_COMMANDS = {
+    "del": (
+        lambda arg, cmd, songs: _try_num_command(arg, "del", _handle_delete, songs),
+        True,
+    ),
+    "ren": (
+        lambda arg, cmd, songs: _try_num_command(arg, "ren", _handle_rename, songs),
+        True,
+    ),
+    "re": (
+        lambda arg, cmd, songs: _try_num_command(arg, "re", _handle_redownload, songs),
+        True,
+    ),
+    "s": (lambda arg, cmd, songs: _handle_stream(arg), True),
+    "loop": (lambda arg, cmd, songs: _handle_loop(cmd, songs), True),
+    "rand": (
+        lambda arg, cmd, songs: _handle_random_offer(cmd, songs),
+        True,
+    ),
+    "top": (lambda arg, cmd, songs: _display_by_play_count(cmd), False),
+    "mode": (lambda arg, cmd, songs: _handle_mode_command(cmd[5:]), False),
+    "date": (lambda arg, cmd, songs: _handle_date_command(cmd[5:], songs), False),
+}
+
+
+def _dispatch_command(user_input, cmd, songs):
     """Route a single user command to its handler.
 
+    Args:
+        user_input: The stripped command as typed.
+        cmd: ``user_input`` lower-cased once by the caller.
+        songs: Alphabetical song list.
+
     Returns:
         bool: True if the library should be refreshed and reprinted.
     """
-    cmd = user_input.lower()
-
-    # --- exact-match commands (dict lookup) ---
-    exact_handlers = {
-        "h": (lambda: _show_help(), False),
-        "help": (lambda: _show_help(), False),
-        "r": (lambda: _handle_replay(), True),
-        "p": (lambda: _playlist_menu(), True),
-        "t": (lambda: _display_timeline(), False),
-        "shuffle": (lambda: _handle_shuffle_all(songs), True),
-        "sh": (lambda: _handle_shuffle_all(songs), True),
-        "rand": (lambda: _handle_random_offer(user_input, songs), True),
-        "date": (lambda: _display_by_date(songs, reverse=False), False),
-        "date r": (lambda: _display_by_date(songs, reverse=True), False),
-        "top": (lambda: _display_by_play_count(songs, user_input), False),
-        "--update-ytdlp": (lambda: _handle_update_ytdlp(), False),
-    }
-    if cmd in exact_handlers:
-        handler, refresh = exact_handlers[cmd]
-        handler()
+
+    # --- exact-match commands ---
+    exact = _EXACT_COMMANDS.get(cmd)
+    if exact:
+        handler, refresh = exact
+        handler(cmd, songs)
         return refresh
 
-    # --- prefix commands (table-driven iteration) ---
-    prefix_handlers = [
-        (
-            "del ",
-            lambda arg: _try_num_command(
-                arg, "del", lambda n: _handle_delete(n, songs)
-            ),
-            True,
-        ),
-        (
-            "ren ",
-            lambda arg: _try_num_command(
-                arg, "ren", lambda n: _handle_rename(n, songs)
-            ),
-            True,
-        ),
-        (
-            "re ",
-            lambda arg: _try_num_command(
-                arg, "re", lambda n: _handle_redownload(n, songs)
-            ),
-            True,
-        ),
-        ("s ", lambda arg: _handle_stream(arg), True),
-        ("loop ", lambda arg: _handle_loop(user_input, songs), True),
-        ("rand ", lambda arg: _handle_random_offer(user_input, songs), True),
-        ("top ", lambda arg: _display_by_play_count(songs, user_input), False),
-        ("mode ", lambda arg: _handle_mode_command(arg), False),
-    ]
-    for prefix, handler, refresh in prefix_handlers:
-        if cmd.startswith(prefix):
-            handler(cmd[len(prefix) :])
+    # --- commands with an argument (dispatch on the first word) ---
+    word, sep, _ = cmd.partition(" ")
+    prefixed = _PREFIX_COMMANDS.get(word) if sep else None
+    if prefixed:
+        handler, refresh = prefixed
+        # Slice the argument from the original input so case is preserved
+        # (stream URLs are case-sensitive)
+        if handler(user_input[len(word) + 1 :], cmd, songs) is not False:
             return refresh
 
     # --- quick-add (case-sensitive "+") ---
-    if user_input.startswith("+"):
+    if user_input[:1] == "+":
         _handle_quick_add(user_input[1:].strip(), songs)
         return False
 
@@ -138,22 +166,40 @@ def _dispatch_command(user_input, songs):
     return _handle_input_fallback(user_input, songs)
 
 
-def _print_current_song_status():
-    """Print a one-line current/up-next status above the prompt."""
+def _current_song_status():
+    """Build the one-line current/up-next status, or None if there is no current song."""
     current_uid = playback_timeline.get_current_song()
     if not current_uid:
-        return
+        return None
     song = song_metadata.get_song(current_uid)
     if not song:
-        return
+        return None
     resume_ms = playback_timeline.get_resume_ms()
     title = _truncate_title(song.get("title", "Unknown"), cv.SCREEN_WIDTH - 32)
-    dur_str = play_song.format_time(song.get("duration", 0))
+    dur_str = _format_duration(song.get("duration", 0))
     if resume_ms > 0:
         pos_str = play_song.format_time(resume_ms // 1000)
-        print(f"\u266a {title}  [{pos_str} / {dur_str}]  \u2014 Enter to resume")
-    else:
-        print(f"\u266a {title}  [{dur_str}]  \u2014 Enter to play")
+        return f"\u266a {title}  [{pos_str} / {dur_str}]  \u2014 Enter to resume"
+    return f"\u266a {title}  [{dur_str}]  \u2014 Enter to play"
+
+
+def _print_current_song_status():
+    """Print a one-line current/up-next status above the prompt.
+
+    The line is rebuilt only when the timeline or the library changed since
+    it was last printed; otherwise the cached line is reused without any
+    database access.
+    """
+    global _status_key, _status_line
+    key = (
+        playback_timeline.get_timeline_version(),
+        song_metadata.get_library_version(),
+    )
+    if key != _status_key:
+        _status_line = _current_song_status()
+        _status_key = key
+    if _status_line:
+        print(_status_line)
 
 
 def _handle_resume_current():
@@ -186,15 +232,18 @@ def display_menu():
         user_input = input("> ").strip()
         cmd = user_input.lower()
 
-        # Empty Enter → resume / play the current song
+        # Empty Enter → resume / play the current song.  Playback does not
+        # touch the library, so only redraw if something else changed it.
         if not user_input:
+            library_version = song_metadata.get_library_version()
             _handle_resume_current()
-            songs = song_metadata.get_songs_alphabetically()
-            _print_library(songs)
+            if song_metadata.get_library_version() != library_version:
+                songs = song_metadata.get_songs_alphabetically()
+                _print_library(songs)
             continue
 
         if cmd in ("q", "x"):
-            print("-" * cv.SCREEN_WIDTH)
+            print(_QUIT_RULE)
             break
 
         if cmd == "l":
@@ -202,73 +251,107 @@ def display_menu():
             _print_library(songs)
             continue
 
-        refresh = _dispatch_command(user_input, songs)
+        refresh = _dispatch_command(user_input, cmd, songs)
 
         if refresh:
             songs = song_metadata.get_songs_alphabetically()
             _print_library(songs)
 
 
+# Fixed pieces of the library screen, built once at import
+_DIVIDER = "=" * cv.SCREEN_WIDTH
+_LIBRARY_HEADER = "SPEAR MUSIC LIBRARY".center(cv.SCREEN_WIDTH)
+_LIBRARY_BANNER = f"{_DIVIDER}\n{_LIBRARY_HEADER}\n{_DIVIDER}\n"
+_QUIT_RULE = "-" * cv.SCREEN_WIDTH
+# 4 (num) + 1 (sp) + title + 1 (sp) + 7 (dur) = col_width
+_LIBRARY_TITLE_WIDTH = cv.SCREEN_WIDTH // 2 - 13
+_LIBRARY_ROW_FMT = f"{{:<4}} {{:<{_LIBRARY_TITLE_WIDTH}}} {{:>7}}"
+_COMMAND_STRIP_1 = (
+    "[ shuffle : rand <N> : loop <num> : t (timeline) : date : top : del/ren/re <num> ]"
+).center(cv.SCREEN_WIDTH)
+_COMMAND_STRIP_2 = (
+    "[ + <num> <pl> : p (playlists) : l (library) : r (replay) : h (help) : q (quit) ]"
+).center(cv.SCREEN_WIDTH)
+
+
 def _print_library(songs):
     """Print song library in two columns
 
+    The whole screen is assembled first and written with a single call
+    (see ``_write_frame``).
+
     Args:
         songs: List of song dictionaries
     """
-    width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print("SPEAR MUSIC LIBRARY".center(width))
-    print("=" * width)
-
     if not songs:
-        print("\nNo songs in library yet. Add songs by entering a YouTube URL.")
-        print("\nCommands: [URL] download | s [URL] stream | r/h/q\n")
+        _write_frame(
+            [
+                "\nNo songs in library yet. Add songs by entering a YouTube URL.",
+                "\nCommands: [URL] download | s [URL] stream | r/h/q\n",
+            ],
+            _LIBRARY_BANNER,
+        )
         return
 
-    # Print songs in two columns
-    col_width = width // 2
-    half = (len(songs) + 1) // 2  # Round up for odd numbers
+    cells = [
+        _LIBRARY_ROW_FMT.format(
+            num,
+            _truncate_title(song["title"], _LIBRARY_TITLE_WIDTH),
+            _format_duration(song.get("duration") or 0),
+        )
+        for num, song in enumerate(songs, 1)
+    ]
 
-    for i in range(half):
-        left_idx = i
-        right_idx = i + half
+    # Two columns: left gets the extra row when the count is odd
+    half = (len(cells) + 1) // 2
+    left, right = cells[:half], cells[half:]
+    lines = [f"{left_text}  {right_text}" for left_text, right_text in zip(left, right)]
+    if len(left) > len(right):
+        lines.append(left[-1])
 
-        # Left column
-        left_song = songs[left_idx]
-        left_num = left_idx + 1
-        title_w = (
-            col_width - 13
-        )  # 4 (num) + 1 (sp) + title + 1 (sp) + 7 (dur) = col_width
-        left_title = _truncate_title(left_song["title"], title_w)
-        left_duration = play_song.format_time(left_song.get("duration", 0))
-        left_text = f"{left_num:<4} {left_title:<{title_w}} {left_duration:>7}"
-
-        # Right column (if exists)
-        if right_idx < len(songs):
-            right_song = songs[right_idx]
-            right_num = right_idx + 1
-            right_title = _truncate_title(right_song["title"], title_w)
-            right_duration = play_song.format_time(right_song.get("duration", 0))
-            right_text = f"{right_num:<4} {right_title:<{title_w}} {right_duration:>7}"
-
-            # Print both columns
-            print(f"{left_text}  {right_text}")
-        else:
-            # Only left column
-            print(left_text)
+    lines.append(_COMMAND_STRIP_1)
+    lines.append(_COMMAND_STRIP_2)
+    _write_frame(lines, _LIBRARY_BANNER)
 
-    # Command strip
-    print(
-        "[ shuffle : rand <N> : loop <num> : t (timeline) : date : top : del/ren/re <num> ]".center(
-            width
-        )
-    )
-    print("[ + <num> <pl> : p (playlists) : l (library) : r (replay) : h (help) : q (quit) ]".center(width))
+
+@lru_cache(maxsize=8)
+def _encoded_header(header, encoding, errors):
+    """Return a fixed screen header encoded for a terminal, built once per encoding."""
+    return header.encode(encoding, errors)
+
+
+def _write_frame(lines, header=""):
+    """Write *header* followed by *lines* to stdout as one pre-encoded block.
+
+    The frame is encoded once and handed to the underlying binary buffer,
+    skipping the text layer's per-write encoding and newline handling; the
+    bytes of a fixed *header* are reused across redraws.  Falls back to a
+    plain text write when stdout has no buffer (e.g. when it has been
+    replaced by a StringIO).
+    """
+    text = "\n".join(lines) + "\n"
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(header + text)
+        return
+    encoding = out.encoding or "utf-8"
+    errors = out.errors or "strict"
+    payload = text.encode(encoding, errors)
+    if header:
+        payload = _encoded_header(header, encoding, errors) + payload
+    out.flush()  # keep ordering with anything print() has buffered
+    buffer.write(payload)
+    buffer.flush()
 
 
+@lru_cache(maxsize=8192)
 def _truncate_title(title, max_length):
     """Truncate title with ellipsis if too long
 
+    Pure in its arguments, so results are cached across redraws; a renamed
+    song simply produces a new key.
+
     Args:
         title: Song title
         max_length: Maximum length
@@ -276,9 +359,27 @@ def _truncate_title(title, max_length):
     Returns:
         str: Truncated title
     """
-    if len(title) <= max_length:
-        return title
-    return title[: max_length - 3] + "..."
+    return title if len(title) <= max_length else title[: max_length - 3] + "..."
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(seconds):
+    """Cached ``play_song.format_time`` for song durations (whole seconds)."""
+    return play_song.format_time(seconds)
+
+
+def _full_path(song):
+    """Return the song's absolute file path, memoized on the song dict.
+
+    ``song_metadata.resolve_path`` re-reads user_specs.yaml on every call,
+    so it cannot be cached by filename alone; library dicts are reused
+    until the library changes, so each song resolves its path at most once
+    per refresh.
+    """
+    full_path = song.get("_full_path")
+    if full_path is None:
+        full_path = song["_full_path"] = song_metadata.resolve_path(song.get("path"))
+    return full_path
 
 
 def _handle_song_selection(user_input, songs):
@@ -379,16 +480,14 @@ def _play_song(song, _from_timeline=False, _single_nav=False, _start_ms=0, _in_p
     """
     global _last_played_uid
 
-    path = song.get("path")
-    uid = song.get("uid")
-    title = song.get("title", "Unknown")
+    path, uid, title = song.get("path"), song.get("uid"), song.get("title", "Unknown")
 
     if not path:
         print(f"\nError: No file path for song '{title}'")
         return False
 
     # Resolve filename to full path via library directory
-    full_path = song_metadata.resolve_path(path)
+    full_path = _full_path(song)
     navigated = False
 
     # While loop handles chained G/H navigation without recursion depth risk
@@ -436,9 +535,8 @@ def _play_song(song, _from_timeline=False, _single_nav=False, _start_ms=0, _in_p
 
         # Chain: update for next iteration
         _from_timeline = True  # All subsequent songs come from the timeline
-        full_path = song_metadata.resolve_path(pending["path"])
-        uid = pending.get("uid")
-        title = pending.get("title", "Unknown")
+        full_path = _full_path(pending)
+        uid, title = pending.get("uid"), pending.get("title", "Unknown")
 
     return navigated
 
@@ -466,8 +564,9 @@ SEARCH:
 
 DISPLAY COMMANDS:
   t                     Show playback timeline (±10 around current position)
-  date                  List all songs by date added (newest first)
-  date r                List all songs by date added (oldest first)
+  date                  List songs by date added (newest first)
+  date r                List songs by date added (oldest first)
+  date [r] <page>       Show another page of the date listing
   top                   Most played songs, all time
   top r                 Least played songs, all time
   top w  /  top wr      Most / least played this week
@@ -501,6 +600,7 @@ PLAYLIST DETAIL (inside playlist):
   rm <position>         Remove song at position
   mv <from> <to>        Move song to new position
   clear                 Remove all songs from playlist
+  n / p                 Next / previous page
   q                     Back to playlist menu
 
 PLAYBACK CONTROLS (while playing):
@@ -558,7 +658,8 @@ def _handle_stream(url):
 def _handle_mode_command(arg):
     """Handle the 'mode' command: switch the next-song selection mode.
 
-    Valid arguments: r/random, a/alpha, h/history, hr/history_r
+    Valid arguments: r/random, a/alpha, h/history, hr/history_r.  *arg* is
+    expected to be lower-cased already.
     """
     mapping = {
         "r": "random",
@@ -570,7 +671,7 @@ def _handle_mode_command(arg):
         "hr": "history_r",
         "history_r": "history_r",
     }
-    mode = mapping.get(arg.strip().lower())
+    mode = mapping.get(arg.strip())
     if not mode:
         print(
             f"Unknown mode '{arg.strip()}'.  Use: "
@@ -628,14 +729,16 @@ def _handle_delete(num, songs):
 
         # Delete file from disk
         full_path = song_metadata.resolve_path(path)
-        if full_path and os.path.exists(full_path):
-            try:
-                os.remove(full_path)
-                print("✓ Deleted from library and disk")
-            except OSError as e:
-                print(f"✓ Deleted from library (file deletion failed: {e})")
-        else:
+        if not full_path:
+            print("✓ Deleted from library (file not found)")
+            return
+        try:
+            os.remove(full_path)
+            print("✓ Deleted from library and disk")
+        except FileNotFoundError:
             print("✓ Deleted from library (file not found)")
+        except OSError as e:
+            print(f"✓ Deleted from library (file deletion failed: {e})")
     else:
         print("Delete cancelled")
 
@@ -701,12 +804,16 @@ def _parse_search_limit(user_input: str) -> tuple[int, str]:
     Returns:
         (limit, query_without_suffix)
     """
+    query = user_input.strip()
+    # A /N suffix must end in a digit; skip the regex for everything else
+    if not query[-1:].isdigit():
+        return cv.DEFAULT_SEARCH_RESULTS, query
     m = _SEARCH_LIMIT_RE.search(user_input)
     if m:
         limit = int(m.group("n"))
         query = user_input[: m.start()].strip()
         return limit, query
-    return cv.DEFAULT_SEARCH_RESULTS, user_input.strip()
+    return cv.DEFAULT_SEARCH_RESULTS, query
 
 
 def _handle_search(query: str, songs: list, limit: int) -> None:
@@ -714,32 +821,32 @@ def _handle_search(query: str, songs: list, limit: int) -> None:
     if not query:
         return
     results = search.fuzzy_search(query, songs, limit=limit)
-    _display_search_results(query, results, songs)
+    _display_search_results(query, results)
 
 
-def _display_search_results(query: str, results: list, alpha_songs: list) -> None:
+def _display_search_results(query: str, results: list) -> None:
     """Print fuzzy search results with alphabetical #indices.
 
     Args:
         query:       The raw search string (for the header).
         results:     Ordered list of matching song dicts.
-        alpha_songs: The full alphabetical song list (for index lookup).
     """
-    alpha_index = {s["uid"]: i + 1 for i, s in enumerate(alpha_songs)}
+    alpha_index = song_metadata.get_alpha_index_map()
     width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print(f'SEARCH: "{query}"'.center(width))
-    print("=" * width)
+    lines = [_DIVIDER, f'SEARCH: "{query}"'.center(width), _DIVIDER]
 
     if not results:
-        print("  No matches found.")
-        print()
+        lines.append("  No matches found.")
+        lines.append("")
+        _write_frame(lines)
         return
 
     # Rank markers: best match (last printed) gets the densest symbol.
     # Top 5 results are marked; the rest get a plain space.
     _RANK_MARKERS = ("█", "▓", "▒", "░")
     total = len(results)
+    title_w = width - 17
+    row_fmt = f"{{}} {{:<4}} {{:<{title_w}}} {{:>7}}"
 
     for rank, song in enumerate(reversed(results)):
         # rank 0 = worst displayed (top of output), rank total-1 = best (bottom)
@@ -751,11 +858,12 @@ def _display_search_results(query: str, results: list, alpha_songs: list) -> Non
 
         uid = song["uid"]
         idx = alpha_index.get(uid, "?")
-        title = _truncate_title(song["title"], width - 17)
-        duration = play_song.format_time(song.get("duration", 0))
-        print(f"{marker} {idx:<4} {title:<{width - 17}} {duration:>7}")
+        title = _truncate_title(song["title"], title_w)
+        duration = _format_duration(song.get("duration") or 0)
+        lines.append(row_fmt.format(marker, idx, title, duration))
 
-    print()
+    lines.append("")
+    _write_frame(lines)
 
 
 def _display_timeline():
@@ -767,25 +875,24 @@ def _display_timeline():
         print("\nTimeline is empty — play some songs first.")
         return
 
-    # Build a dict keyed by position for fast lookup
-    by_pos = {entry["position"]: entry["song_uid"] for entry in timeline}
+    # The timeline is ordered by position, so the ±10 window is a slice
+    positions = [entry["position"] for entry in timeline]
+    window = timeline[
+        bisect_left(positions, cursor - 10) : bisect_right(positions, cursor + 10)
+    ]
 
-    lo = cursor - 10
-    hi = cursor + 10
-    positions = sorted(pos for pos in by_pos if lo <= pos <= hi)
+    songs_by_uid = song_metadata.get_songs(entry["song_uid"] for entry in window)
 
     width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print("PLAYBACK TIMELINE".center(width))
-    print("=" * width)
+    lines = [_DIVIDER, "PLAYBACK TIMELINE".center(width), _DIVIDER]
 
-    for pos in positions:
-        uid = by_pos[pos]
-        song = song_metadata.get_song(uid)
+    for entry in window:
+        pos = entry["position"]
+        song = songs_by_uid.get(entry["song_uid"])
 
         if song:
             title = _truncate_title(song["title"], width - 22)
-            duration = play_song.format_time(song.get("duration", 0))
+            duration = _format_duration(song.get("duration", 0))
             meta = f"{title} {duration:>7}"
         else:
             meta = "[deleted]"
@@ -799,46 +906,83 @@ def _display_timeline():
         else:
             label = f"  {'':2}  +{offset}   {meta}"
 
-        print(label)
+        lines.append(label)
+
+    _write_frame(lines)
+
+
+def _page_count(total):
+    """Number of PAGE_SIZE pages needed for *total* rows (at least one)."""
+    return max(1, -(-total // cv.PAGE_SIZE))
+
+
+def _handle_date_command(arg, songs):
+    """Handle 'date [r] <page>': show one page of the date listing.
+
+    Returns:
+        bool: False if *arg* is not a page, so the input is searched
+        instead (e.g. "date night").
+    """
+    parts = arg.split()
+    reverse = parts[:1] == ["r"]
+    if reverse:
+        parts = parts[1:]
+    if len(parts) != 1 or not parts[0].isdecimal():
+        return False
+    _display_by_date(songs, reverse=reverse, page=int(parts[0]))
+    return True
+
 
+def _display_by_date(songs, reverse=False, page=1):
+    """Print one page of songs sorted by date added.
 
-def _display_by_date(songs, reverse=False):
-    """Print all songs sorted by date added.
+    Page 1 holds the newest songs (oldest with *reverse*); only that page
+    is fetched from the database.
 
     Args:
         songs: Alphabetical song list (used to derive #indices for playback).
         reverse: False = newest first (default), True = oldest first.
+        page: 1-based page number, clamped to the available pages.
     """
-    # get_all_songs() returns ORDER BY add_date DESC already
-    dated = song_metadata.get_all_songs()
-    if reverse:
-        dated = list(reversed(dated))
+    pages = _page_count(len(songs))
+    page = min(max(page, 1), pages)
+    dated = song_metadata.get_songs_by_date(
+        newest_first=not reverse,
+        limit=cv.PAGE_SIZE,
+        offset=(page - 1) * cv.PAGE_SIZE,
+    )
+    # Printed top to bottom, so the head of the range lands next to the prompt
+    dated.reverse()
 
     if not dated:
         print("\nNo songs in library.")
         return
 
-    # Build uid → 1-based alphabetical index map
-    alpha_index = {s["uid"]: i + 1 for i, s in enumerate(songs)}
+    # uid → 1-based alphabetical index map (cached until the library changes)
+    alpha_index = song_metadata.get_alpha_index_map()
 
     direction = "oldest first" if reverse else "newest first"
     width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print(f"SONGS BY DATE ADDED  ({direction})".center(width))
-    print("=" * width)
+    lines = [_DIVIDER, f"SONGS BY DATE ADDED  ({direction})".center(width), _DIVIDER]
 
-    for song in reversed(dated):
+    title_w = width - 30
+    row_fmt = f"  {{:<4}}  {{:<{title_w}}} {{:>7}}  {{}}"
+    for song in dated:
         uid = song["uid"]
         idx = alpha_index.get(uid, "?")
-        title = _truncate_title(song["title"], width - 30)
-        duration = play_song.format_time(song.get("duration", 0))
+        title = _truncate_title(song["title"], title_w)
+        duration = _format_duration(song.get("duration", 0))
         add_date = song.get("add_date", "")[:10]  # YYYY-MM-DD
-        print(f"  {idx:<4}  {title:<{width - 30}} {duration:>7}  {add_date}")
+        lines.append(row_fmt.format(idx, title, duration, add_date))
 
-    print()
+    if pages > 1:
+        command = "date r" if reverse else "date"
+        lines.append(f"\n  Page {page}/{pages} — {command} <page> for more")
+    lines.append("")
+    _write_frame(lines)
 
 
-def _display_by_play_count(songs, user_input):
+def _display_by_play_count(user_input):
     """Print songs ranked by play count for a chosen time period.
 
     Supported sub-commands after 'top':
@@ -850,7 +994,6 @@ def _display_by_play_count(songs, user_input):
         <N> / <N>r   last N days desc / asc  (e.g. "top 30", "top 30r")
 
     Args:
-        songs: Alphabetical song list (used to derive #indices for playback).
         user_input: Raw command string from the user (e.g. "top m").
     """
     parts = user_input.strip().split(maxsplit=1)
@@ -860,23 +1003,24 @@ def _display_by_play_count(songs, user_input):
     # Strip trailing 'r' for period lookup
     period_key = sub.rstrip("r").strip()
 
-    # Dispatch
+    # Dispatch.  Rows are requested in print order — the head of the ranking
+    # last, next to the prompt — so SQL sorts the opposite way to the view.
     if sub == "" or sub == "r":
         period_label = "ALL TIME"
-        ranked = listen_history.get_top_songs_all_time(reverse=(sub == "r"))
+        ranked = listen_history.get_top_songs_all_time(reverse=(sub != "r"))
     elif period_key == "w":
         period_label = "THIS WEEK"
-        ranked = listen_history.get_top_songs_this_week(reverse=reverse)
+        ranked = listen_history.get_top_songs_this_week(reverse=not reverse)
     elif period_key == "m":
         period_label = "THIS MONTH"
-        ranked = listen_history.get_top_songs_this_month(reverse=reverse)
+        ranked = listen_history.get_top_songs_this_month(reverse=not reverse)
     elif period_key == "y":
         period_label = "THIS YEAR"
-        ranked = listen_history.get_top_songs_this_year(reverse=reverse)
+        ranked = listen_history.get_top_songs_this_year(reverse=not reverse)
     elif period_key.isdigit():
         days = int(period_key)
         period_label = f"LAST {days} DAYS"
-        ranked = listen_history.get_top_songs_last_n_days(days, reverse=reverse)
+        ranked = listen_history.get_top_songs_last_n_days(days, reverse=not reverse)
     else:
         print(
             f"Unknown top command: '{user_input}'  (try: top / top w / top m / top y / top 30)"
@@ -890,23 +1034,25 @@ def _display_by_play_count(songs, user_input):
         print(f"\nNo listen history for {period_label.lower()}.")
         return
 
-    # Build uid → 1-based alphabetical index map
-    alpha_index = {s["uid"]: i + 1 for i, s in enumerate(songs)}
+    # uid → 1-based alphabetical index map (cached until the library changes)
+    alpha_index = song_metadata.get_alpha_index_map()
 
     width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print(header.center(width))
-    print("=" * width)
+    lines = [_DIVIDER, header.center(width), _DIVIDER]
 
-    for entry in reversed(list(ranked)):
+    title_w = width - 22
+    row_fmt = f"  {{:<4}}  {{:<{title_w}}}  {{}} {{}}"
+    for entry in ranked:
         uid = entry["uid"]
         idx = alpha_index.get(uid)
         if idx is None:
             continue  # Song deleted from library — skip
-        title = _truncate_title(entry["title"], width - 22)
+        title = _truncate_title(entry["title"], title_w)
         count = entry["listen_count"]
         plays = "play" if count == 1 else "plays"
-        print(f"  {idx:<4}  {title:<{width - 22}}  {count} {plays}")
+        lines.append(row_fmt.format(idx, title, count, plays))
+
+    _write_frame(lines)
 
 
 # ============================================================================
@@ -920,12 +1066,11 @@ def _pick_next_alpha_song_uid():
     songs = song_metadata.get_songs_alphabetically()
     if not songs:
         return None
-    if not current_uid:
-        return songs[0].get("uid")
-    for i, s in enumerate(songs):
-        if s.get("uid") == current_uid:
-            return songs[(i + 1) % len(songs)].get("uid")
-    return songs[0].get("uid")  # Fallback
+    # 1-based position of the current song == 0-based index of the next one
+    position = song_metadata.get_alpha_index_map().get(current_uid)
+    if position is None:
+        return songs[0].get("uid")  # No current song, or it was deleted
+    return songs[position % len(songs)].get("uid")
 
 
 def _pick_next_current():
@@ -962,16 +1107,19 @@ def _handle_adhoc_queue(tokens, songs):
         tokens: List of digit strings representing 1-based song indices
         songs: Current full song list
     """
-    indices = []
-    for t in tokens:
-        idx = int(t)
-        if idx < 1 or idx > len(songs):
-            print(f"Invalid song number: {idx} (must be 1-{len(songs)})")
-            return
-        indices.append(idx)
+    indices = list(map(int, tokens))
+    count = len(songs)
+    if not indices:
+        return
+    # Digits only, so a single bounds check on the extremes covers the list
+    if min(indices) < 1 or max(indices) > count:
+        bad = next(idx for idx in indices if not 1 <= idx <= count)
+        print(f"Invalid song number: {bad} (must be 1-{count})")
+        return
 
-    queue = [{"uid": songs[i - 1]["uid"]} for i in indices]
-    titles = ", ".join(songs[i - 1]["title"][:20] for i in indices[:3])
+    picked = [songs[i - 1] for i in indices]
+    queue = [{"uid": song["uid"]} for song in picked]
+    titles = ", ".join(song["title"][:20] for song in picked[:3])
     ellipsis = "..." if len(indices) > 3 else ""
     print(f"\n▶ Ad-hoc queue: {titles}{ellipsis}  ({len(indices)} songs)")
     _play_playlist(queue, shuffle=False)
@@ -1009,6 +1157,8 @@ def _handle_random_offer(user_input, songs):
             print("Invalid count. Usage: rand [number]")
             return
 
+    # songs is the cached library list; sample() only touches the n picked
+    # entries, so no copy or extra query is needed
     n = min(n, len(songs))
     offered = random.sample(songs, n)
 
@@ -1018,7 +1168,7 @@ def _handle_random_offer(user_input, songs):
     print("=" * width)
     for i, s in enumerate(offered, 1):
         title = _truncate_title(s["title"], width - 17)
-        duration = play_song.format_time(s.get("duration", 0))
+        duration = _format_duration(s.get("duration") or 0)
         print(f"  {i:<3} {title:<{width - 17}} {duration:>7}")
     print()
 
@@ -1066,7 +1216,7 @@ def _handle_loop(user_input, songs):
         return
 
     # Resolve filename to full path via library directory
-    full_path = song_metadata.resolve_path(path)
+    full_path = _full_path(song)
 
     global _last_played_uid
     _last_played_uid = uid
@@ -1090,6 +1240,57 @@ def _handle_loop(user_input, songs):
 # ============================================================================
 
 
+def _try_num_args(arg, count, usage, handler):
+    """Parse *count* numbers from *arg* and call ``handler(*nums)``, or print usage."""
+    parts = arg.split()
+    if len(parts) != count or not all(part.isdecimal() for part in parts):
+        print(f"Invalid command. Usage: {usage}")
+        return
+    handler(*map(int, parts))
+
+
+# Playlist-list commands with arguments: word -> handler(arg, all_playlists)
+_PLAYLIST_COMMANDS = {
+    "del": lambda arg, pls: _try_num_args(
+        arg, 1, "del <number>", lambda num: _handle_delete_playlist(num, pls)
+    ),
+    "ren": lambda arg, pls: _try_num_args(
+        arg, 1, "ren <number>", lambda num: _handle_rename_playlist(num, pls)
+    ),
+    "dup": lambda arg, pls: _try_num_args(
+        arg, 1, "dup <number>", lambda num: _handle_duplicate_playlist(num, pls)
+    ),
+    "merge": lambda arg, pls: _try_num_args(
+        arg,
+        2,
+        "merge <src_num> <dest_num>",
+        lambda src, dest: _handle_merge_playlists(src, dest, pls),
+    ),
+}
+
+# Playlist-detail commands with arguments: word -> handler(arg, playlist_uid, songs)
+_PLAYLIST_DETAIL_COMMANDS = {
+    "add": lambda arg, uid, songs: _try_num_args(
+        arg,
+        1,
+        "add <song_number>",
+        lambda num: _handle_add_song_to_playlist(uid, num),
+    ),
+    "rm": lambda arg, uid, songs: _try_num_args(
+        arg,
+        1,
+        "rm <position>",
+        lambda pos: _handle_remove_from_playlist(uid, pos, songs),
+    ),
+    "mv": lambda arg, uid, songs: _try_num_args(
+        arg,
+        2,
+        "mv <from> <to>",
+        lambda from_pos, to_pos: _handle_move_song(uid, from_pos, to_pos, songs),
+    ),
+}
+
+
 def _playlist_menu():
     """Display playlist management menu"""
     while True:
@@ -1097,55 +1298,22 @@ def _playlist_menu():
         _display_playlists(all_playlists)
 
         user_input = input("> ").strip()
+        cmd = user_input.lower()
 
         # Back to main menu
-        if user_input.lower() in ["q", "x", "b"]:
+        if cmd in ["q", "x", "b"]:
             break
 
         # Create playlist
-        if user_input.lower() == "c":
+        if cmd == "c":
             _handle_create_playlist()
             continue
 
-        # Delete playlist
-        if user_input.lower().startswith("del "):
-            try:
-                num = int(user_input[4:].strip())
-                _handle_delete_playlist(num, all_playlists)
-            except ValueError:
-                print("Invalid command. Usage: del <number>")
-            continue
-
-        # Rename playlist
-        if user_input.lower().startswith("ren "):
-            try:
-                num = int(user_input[4:].strip())
-                _handle_rename_playlist(num, all_playlists)
-            except ValueError:
-                print("Invalid command. Usage: ren <number>")
-            continue
-
-        # Duplicate playlist
-        if user_input.lower().startswith("dup "):
-            try:
-                num = int(user_input[4:].strip())
-                _handle_duplicate_playlist(num, all_playlists)
-            except ValueError:
-                print("Invalid command. Usage: dup <number>")
-            continue
-
-        # Merge playlists
-        if user_input.lower().startswith("merge "):
-            parts = user_input[6:].strip().split()
-            if len(parts) == 2:
-                try:
-                    src = int(parts[0])
-                    dest = int(parts[1])
-                    _handle_merge_playlists(src, dest, all_playlists)
-                except ValueError:
-                    print("Invalid command. Usage: merge <src_num> <dest_num>")
-            else:
-                print("Invalid command. Usage: merge <src_num> <dest_num>")
+        # del / ren / dup / merge <numbers>
+        word, sep, arg = cmd.partition(" ")
+        handler = _PLAYLIST_COMMANDS.get(word) if sep else None
+        if handler:
+            handler(arg, all_playlists)
             continue
 
         # Enter playlist detail view
@@ -1162,17 +1330,17 @@ def _playlist_menu():
 def _display_playlists(all_playlists):
     """Display all playlists with song counts"""
     width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print("PLAYLISTS".center(width))
-    print("=" * width)
+    lines = [_DIVIDER, "PLAYLISTS".center(width), _DIVIDER]
 
     if not all_playlists:
-        print("\nNo playlists yet. Press 'c' to create one.")
-        print("\nCommands: c create | q back\n")
+        lines.append("\nNo playlists yet. Press 'c' to create one.")
+        lines.append("\nCommands: c create | q back\n")
+        _write_frame(lines)
         return
 
     col_width = width // 2
     half = (len(all_playlists) + 1) // 2
+    all_stats = playlists.get_all_playlist_stats()
 
     for i in range(half):
         left_idx = i
@@ -1180,7 +1348,7 @@ def _display_playlists(all_playlists):
 
         # Left column
         pl = all_playlists[left_idx]
-        stats = playlists.get_playlist_stats(pl["uid"])
+        stats = all_stats.get(pl["uid"])
         count = stats["song_count"] if stats else 0
         empty_tag = " (empty)" if count == 0 else ""
         left_text = f"{left_idx + 1}  {_truncate_title(pl['name'], col_width - 18)} ({count} songs){empty_tag}"
@@ -1188,20 +1356,24 @@ def _display_playlists(all_playlists):
         # Right column
         if right_idx < len(all_playlists):
             pl_r = all_playlists[right_idx]
-            stats_r = playlists.get_playlist_stats(pl_r["uid"])
+            stats_r = all_stats.get(pl_r["uid"])
             count_r = stats_r["song_count"] if stats_r else 0
             empty_tag_r = " (empty)" if count_r == 0 else ""
             right_text = f"{right_idx + 1}  {_truncate_title(pl_r['name'], col_width - 18)} ({count_r} songs){empty_tag_r}"
-            print(f"{left_text:<{col_width}}{right_text}")
+            lines.append(f"{left_text:<{col_width}}{right_text}")
         else:
-            print(left_text)
+            lines.append(left_text)
 
-    print("\n[num] view | c create | del/ren/dup [num] | merge [src] [dest] | q back\n")
+    lines.append(
+        "\n[num] view | c create | del/ren/dup [num] | merge [src] [dest] | q back\n"
+    )
+    _write_frame(lines)
 
 
 def _playlist_detail_menu(playlist):
     """Display and manage a single playlist's contents"""
     playlist_uid = playlist["uid"]
+    page = 1
 
     while True:
         songs = playlists.get_playlist_songs(playlist_uid)
@@ -1211,16 +1383,35 @@ def _playlist_detail_menu(playlist):
             print("Playlist not found")
             break
 
-        _display_playlist_songs(pl_data, songs)
+        # Songs may have been removed since the last render
+        page = min(page, _page_count(len(songs)))
+        _display_playlist_songs(pl_data, songs, page)
 
         user_input = input("> ").strip()
+        cmd = user_input.lower()
 
         # Back to playlist menu
-        if user_input.lower() in ["q", "x", "b"]:
+        if cmd in ["q", "x", "b"]:
             break
 
+        # Page navigation
+        if cmd == "n":
+            page += 1
+            continue
+        if cmd == "p":
+            page = max(page - 1, 1)
+            continue
+        if cmd.startswith("/p "):
+            arg = cmd[3:].strip()
+            if arg.isdecimal():
+                # Clamped to the last page on the next render
+                page = max(int(arg), 1)
+            else:
+                print("Invalid page command. Usage: /p <page>")
+            continue
+
         # Play all
-        if user_input.lower() == "play":
+        if cmd == "play":
             if not songs:
                 print("Playlist is empty")
             else:
@@ -1228,47 +1419,22 @@ def _playlist_detail_menu(playlist):
             continue
 
         # Play shuffled
-        if user_input.lower() == "play shuffle":
+        if cmd == "play shuffle":
             if not songs:
                 print("Playlist is empty")
             else:
                 _play_playlist(songs, shuffle=True)
             continue
 
-        # Add song from library
-        if user_input.lower().startswith("add "):
-            try:
-                song_num = int(user_input[4:].strip())
-                _handle_add_song_to_playlist(playlist_uid, song_num)
-            except ValueError:
-                print("Invalid command. Usage: add <song_number>")
-            continue
-
-        # Remove song at position
-        if user_input.lower().startswith("rm "):
-            try:
-                pos = int(user_input[3:].strip())
-                _handle_remove_from_playlist(playlist_uid, pos, songs)
-            except ValueError:
-                print("Invalid command. Usage: rm <position>")
-            continue
-
-        # Move song
-        if user_input.lower().startswith("mv "):
-            parts = user_input[3:].strip().split()
-            if len(parts) == 2:
-                try:
-                    from_pos = int(parts[0])
-                    to_pos = int(parts[1])
-                    _handle_move_song(playlist_uid, from_pos, to_pos, songs)
-                except ValueError:
-                    print("Invalid command. Usage: mv <from> <to>")
-            else:
-                print("Invalid command. Usage: mv <from> <to>")
+        # add / rm / mv <numbers>
+        word, sep, arg = cmd.partition(" ")
+        handler = _PLAYLIST_DETAIL_COMMANDS.get(word) if sep else None
+        if handler:
+            handler(arg, playlist_uid, songs)
             continue
 
         # Clear playlist
-        if user_input.lower() == "clear":
+        if cmd == "clear":
             _handle_clear_playlist(playlist_uid, pl_data["name"])
             continue
 
@@ -1288,32 +1454,46 @@ def _playlist_detail_menu(playlist):
             print("Invalid input")
 
 
-def _display_playlist_songs(playlist, songs):
-    """Display songs in a playlist"""
+def _display_playlist_songs(playlist, songs, page=1):
+    """Display one page of the songs in a playlist
+
+    Args:
+        playlist: Playlist dict
+        songs: All songs in the playlist, in position order
+        page: 1-based page number (must be valid for ``songs``)
+    """
     width = cv.SCREEN_WIDTH
-    print("=" * width)
-    print(f"PLAYLIST: {playlist['name']}".center(width))
-    print("=" * width)
+    lines = [_DIVIDER, f"PLAYLIST: {playlist['name']}".center(width), _DIVIDER]
 
     if not songs:
-        print("\n(empty playlist)")
-        print("\nCommands: add <num> | play | q back\n")
+        lines.append("\n(empty playlist)")
+        lines.append("\nCommands: add <num> | play | q back\n")
+        _write_frame(lines)
         return
 
     # Show songs with positions
-    for song in songs:
-        pos = song["position"]
-        title = _truncate_title(song.get("title") or "Unknown", width - 17)
-        duration = play_song.format_time(song.get("duration") or 0)
-        print(f"  {pos:<4} {title:<{width - 17}} {duration:>7}")
+    title_w = width - 17
+    row_fmt = f"  {{:<4}} {{:<{title_w}}} {{:>7}}"
+    start = (page - 1) * cv.PAGE_SIZE
+    for song in songs[start : start + cv.PAGE_SIZE]:
+        title = _truncate_title(song.get("title") or "Unknown", title_w)
+        duration = _format_duration(song.get("duration") or 0)
+        lines.append(row_fmt.format(song["position"], title, duration))
 
     # Stats
     stats = playlists.get_playlist_stats(playlist["uid"])
     if stats:
         total_dur = play_song.format_time(stats["total_duration"])
-        print(f"\n  Total: {stats['song_count']} songs, {total_dur}")
+        lines.append(f"\n  Total: {stats['song_count']} songs, {total_dur}")
+
+    pages = _page_count(len(songs))
+    if pages > 1:
+        lines.append(f"  Page {page}/{pages} — n next | p prev | /p <page> jump")
 
-    print("\n[pos] play | play [shuffle] | add/rm [num] | mv [from] [to] | clear | q\n")
+    lines.append(
+        "\n[pos] play | play [shuffle] | add/rm [num] | mv [from] [to] | clear | q\n"
+    )
+    _write_frame(lines)
 
 
 def _play_playlist(songs, shuffle=False):
@@ -1337,12 +1517,15 @@ def _play_playlist(songs, shuffle=False):
     # The cursor is now at base+1 (first song).
     timeline_base = playback_timeline.get_cursor() - 1
 
+    # One lookup for the whole queue instead of one per song
+    songs_by_uid = song_metadata.get_songs(valid_uids)
+
     aborted = False
     navigated_away = False
     i = 0
     while i < len(song_list):
         song_item = song_list[i]
-        song = song_metadata.get_song(song_item["uid"])
+        song = songs_by_uid.get(song_item.get("uid"))
         if not song:
             print("Skipping: song not found in library")
             # Keep cursor in sync even for skipped entries
@@ -1,8 +1,11 @@
 """Export database tables to CSV files"""
 
 import csv
+import gzip
 import os
 import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import constants as cv
@@ -10,52 +13,90 @@ import constants as cv
 DB_PATH = cv.DB_PATH
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "data", "exports")
 
+# Tables written by export_all_tables
+EXPORT_TABLES = ("listen_history", "songs")
 
-def export_table_to_csv(table_name, output_path):
+# Rows fetched from SQLite per write while exporting
+EXPORT_BATCH_SIZE = 1000
+
+# Output file buffer; csv.writer is already implemented in C, so the
+# remaining per-row cost is mostly small writes to the file
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def export_table_to_csv(table_name, output_path, compress=False):
     """Export a database table to CSV
 
     Args:
         table_name: Name of the table to export
         output_path: Path where CSV file should be saved
+        compress: Write gzip-compressed CSV (fast level 1) instead of plain text
     """
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
+    cursor.arraysize = EXPORT_BATCH_SIZE
 
-    # Get all rows from the table
+    # Rows are streamed in batches rather than loaded all at once
     cursor.execute(f"SELECT * FROM {table_name}")
-    rows = cursor.fetchall()
 
     # Get column names
     column_names = [description[0] for description in cursor.description]
 
     # Write to CSV
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
+    row_count = 0
+    if compress:
+        csvfile = gzip.open(
+            output_path, "wt", compresslevel=1, newline="", encoding="utf-8"
+        )
+    else:
+        csvfile = open(
+            output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=EXPORT_BUFFER_SIZE,
+        )
+    with csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(column_names)
-        writer.writerows(rows)
+        while rows := cursor.fetchmany():
+            writer.writerows(rows)
+            row_count += len(rows)
 
     conn.close()
-    print(f"Exported {len(rows)} rows from {table_name} to {output_path}")
+    print(f"Exported {row_count} rows from {table_name} to {output_path}")
+
 
+def export_all_tables(compress=False):
+    """Export all tables to CSV files with timestamp
 
-def export_all_tables():
-    """Export all tables to CSV files with timestamp"""
+    Args:
+        compress: Write .csv.gz files instead of plain .csv
+    """
     # Create output directory if it doesn't exist
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     # Generate timestamp for filenames
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    # Export listen_history table
-    listen_history_path = os.path.join(OUTPUT_DIR, f"listen_history_{timestamp}.csv")
-    export_table_to_csv("listen_history", listen_history_path)
-
-    # Export songs table
-    songs_path = os.path.join(OUTPUT_DIR, f"songs_{timestamp}.csv")
-    export_table_to_csv("songs", songs_path)
+    extension = ".csv.gz" if compress else ".csv"
+
+    # Export the tables concurrently, each over its own connection: reads
+    # and file writes release the GIL, and WAL lets the readers overlap
+    with ThreadPoolExecutor(max_workers=len(EXPORT_TABLES)) as executor:
+        futures = [
+            executor.submit(
+                export_table_to_csv,
+                table_name,
+                os.path.join(OUTPUT_DIR, f"{table_name}_{timestamp}{extension}"),
+                compress,
+            )
+            for table_name in EXPORT_TABLES
+        ]
+        for future in futures:
+            future.result()
 
     print(f"\nExport complete! Files saved to: {OUTPUT_DIR}")
 
 
 if __name__ == "__main__":
-    export_all_tables()
+    export_all_tables(compress="--gzip" in sys.argv[1:])
@@ -1,19 +1,69 @@
+import atexit
+import logging
 import os
+import sqlite3
+import threading
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 import constants as cv
+from db_utils import enable_wal as _enable_wal
 from db_utils import get_connection as _get_connection
 from db_utils import validate_uid as _validate_uid
 
 # Constants
 DB_PATH = cv.DB_PATH
 
+_logger = logging.getLogger(__name__)
 
-def _execute_aggregation_query(where_clause, params, limit, reverse, db_path):
-    """Execute aggregation query with song titles joined from songs table"""
-    order = "ASC" if reverse else "DESC"
+# Logged listens are buffered and written in one transaction once this
+# many are pending, or this many seconds after the first one
+_FLUSH_SIZE = 32
+_FLUSH_INTERVAL = 5.0
 
-    query = f"""
+# A failed timer flush is retried after twice the previous delay, up to
+# this many seconds
+_FLUSH_RETRY_MAX = 300.0
+
+# Pending (db_path, song_uid, listened_at) rows not yet written.
+# _pending_lock guards the buffer and timer and is only held briefly, so
+# log_listen never waits on the database; _write_lock serializes flushes,
+# so a query's flush also waits for one already writing
+_pending = deque()
+_pending_lock = threading.Lock()
+_write_lock = threading.Lock()
+_flush_timer = None
+
+
+@lru_cache(maxsize=None)
+def _aggregation_query(where_clause, reverse, has_limit):
+    """Return the SQL for one aggregation query shape
+
+    Only a handful of shapes exist, so each string is built once.  The
+    limit is a bound parameter and the text is stable, so SQLite's
+    per-connection statement cache (kept alive by the connection pool)
+    reuses the compiled statement instead of re-preparing it.
+    """
+    order = "ASC" if reverse else "DESC"
+    if has_limit:
+        # Rank and cut in the CTE first, so only the surviving rows are
+        # joined against songs for their titles
+        return f"""
+            WITH top AS (
+                SELECT lh.song_uid, COUNT(*) as listen_count
+                FROM listen_history lh
+                {where_clause}
+                GROUP BY lh.song_uid
+                ORDER BY listen_count {order}
+                LIMIT ?
+            )
+            SELECT top.song_uid, s.title, top.listen_count
+            FROM top
+            LEFT JOIN songs s ON top.song_uid = s.uid
+            ORDER BY top.listen_count {order}
+        """
+    return f"""
         SELECT lh.song_uid, s.title, COUNT(*) as listen_count
         FROM listen_history lh
         LEFT JOIN songs s ON lh.song_uid = s.uid
@@ -22,20 +72,59 @@ def _execute_aggregation_query(where_clause, params, limit, reverse, db_path):
         ORDER BY listen_count {order}
     """
 
+
+def _fetch_ranking(query, params, limit, db_path):
+    """Run a ranking query built for *limit* and return its rows as dicts"""
+    flush_listens()
+
     if limit is not None:
         if not isinstance(limit, int) or limit < 0:
             raise ValueError(f"limit must be a non-negative integer, got: {limit}")
-        query += f" LIMIT {limit}"
+        params = (*params, limit)
 
     with _get_connection(db_path) as conn:
         cursor = conn.cursor()
         cursor.execute(query, params)
+        # Iterate the cursor directly: rows stream from SQLite without an
+        # intermediate fetchall() list
         return [
             {"uid": row[0], "title": row[1], "listen_count": row[2]}
-            for row in cursor.fetchall()
+            for row in cursor
         ]
 
 
+def _execute_aggregation_query(where_clause, params, limit, reverse, db_path):
+    """Execute aggregation query with song titles joined from songs table"""
+    query = _aggregation_query(where_clause, reverse, limit is not None)
+    return _fetch_ranking(query, params, limit, db_path)
+
+
+@lru_cache(maxsize=None)
+def _all_time_query(reverse, has_limit):
+    """Return the SQL ranking songs by their materialized all-time count"""
+    order = "ASC" if reverse else "DESC"
+    query = f"""
+        SELECT sc.song_uid, s.title, sc.n
+        FROM song_counts sc
+        LEFT JOIN songs s ON sc.song_uid = s.uid
+        WHERE sc.n > 0
+        ORDER BY sc.n {order}
+    """
+    if has_limit:
+        query += " LIMIT ?"
+    return query
+
+
+@lru_cache(maxsize=8)
+def _iso_bound(start):
+    """Return *start* as ISO text for a query bound
+
+    The current week/month/year starts only change at midnight, so the
+    "this week/month/year" views format the same few values all day.
+    """
+    return start.isoformat()
+
+
 def _get_start_of_week():
     """Calculate start of current week (Monday at 00:00:00)"""
     now = datetime.now()
@@ -55,12 +144,51 @@ def _get_start_of_year():
     return now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
+def _period_range(start, end):
+    """Return ISO bounds for ``start <= listened_at < end`` predicates
+
+    ISO-8601 timestamps sort as text in time order, so a range over the
+    stored strings can use the listened_at indexes, unlike strftime().
+    """
+    return (start.isoformat(), end.isoformat())
+
+
+@lru_cache(maxsize=64)
+def _year_range(year):
+    """Bounds of a calendar year"""
+    return _period_range(datetime(year, 1, 1), datetime(year + 1, 1, 1))
+
+
+@lru_cache(maxsize=64)
+def _month_range(year, month):
+    """Bounds of a calendar month"""
+    if month == 12:
+        return _period_range(datetime(year, 12, 1), datetime(year + 1, 1, 1))
+    return _period_range(datetime(year, month, 1), datetime(year, month + 1, 1))
+
+
+@lru_cache(maxsize=64)
+def _week_range(year, week):
+    """Bounds of strftime('%W') week *week* of *year*
+
+    Week 1 starts on the year's first Monday; like strftime, the range
+    never extends past the end of the year (it may be empty for week 53).
+    """
+    new_year = datetime(year, 1, 1)
+    first_monday = new_year + timedelta(days=(7 - new_year.weekday()) % 7)
+    start = first_monday + timedelta(weeks=week - 1)
+    end = min(start + timedelta(weeks=1), datetime(year + 1, 1, 1))
+    return _period_range(start, max(start, end))
+
+
 def init_database(db_path=DB_PATH):
     """Create database and tables if they don't exist"""
     # Ensure the data directory exists
     os.makedirs(os.path.dirname(db_path), exist_ok=True)
 
     with _get_connection(db_path) as conn:
+        # Listens are logged while other screens read, so use WAL
+        _enable_wal(conn)
         cursor = conn.cursor()
 
         cursor.execute(
@@ -90,10 +218,60 @@ def init_database(db_path=DB_PATH):
             ON listen_history(song_uid)
         """
         )
+        # Covers the period queries: the range scan and the per-song
+        # grouping are both answered from the index alone.  It also serves
+        # every lookup the plain listened_at index did, so that one is
+        # dropped from older databases rather than maintained on each insert
         cursor.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_listened_at
-            ON listen_history(listened_at)
+            CREATE INDEX IF NOT EXISTS idx_listened_at_song_uid
+            ON listen_history(listened_at, song_uid)
+        """
+        )
+        cursor.execute("DROP INDEX IF EXISTS idx_listened_at")
+
+        # All-time counts per song, kept current by triggers so the
+        # all-time ranking never has to aggregate the whole history
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS song_counts (
+                song_uid TEXT PRIMARY KEY,
+                n INTEGER NOT NULL DEFAULT 0
+            )
+        """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_song_counts_n
+            ON song_counts(n)
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_song_counts_insert
+            AFTER INSERT ON listen_history
+            BEGIN
+                INSERT INTO song_counts (song_uid, n) VALUES (NEW.song_uid, 1)
+                ON CONFLICT(song_uid) DO UPDATE SET n = n + 1;
+            END
+        """
+        )
+        cursor.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_song_counts_delete
+            AFTER DELETE ON listen_history
+            BEGIN
+                UPDATE song_counts SET n = n - 1 WHERE song_uid = OLD.song_uid;
+            END
+        """
+        )
+        # Backfill a history recorded before the table existed
+        cursor.execute(
+            """
+            INSERT INTO song_counts (song_uid, n)
+            SELECT song_uid, COUNT(*) FROM listen_history
+            WHERE NOT EXISTS (SELECT 1 FROM song_counts)
+            GROUP BY song_uid
         """
         )
 
@@ -103,16 +281,99 @@ def init_database(db_path=DB_PATH):
 
 
 def log_listen(song_uid, db_path=DB_PATH):
-    """Record that a song was just listened to"""
+    """Record that a song was just listened to
+
+    The row is buffered and written by ``flush_listens``, which runs once
+    enough listens are pending, shortly after the first, before any query
+    in this module, and at exit.
+    """
     _validate_uid(song_uid, "song_uid")
 
-    with _get_connection(db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO listen_history (song_uid, listened_at) VALUES (?, ?)",
-            (song_uid, datetime.now().isoformat()),
+    with _pending_lock:
+        # Local-time ISO text with microseconds: the period queries compare
+        # against local ISO bounds, and the format is what existing
+        # databases and exports hold.  Formatting costs about a microsecond
+        # on an event that happens once per song.
+        _pending.append((db_path, song_uid, datetime.now().isoformat()))
+        flush_now = len(_pending) >= _FLUSH_SIZE
+        if not flush_now and _flush_timer is None:
+            _start_flush_timer(_FLUSH_INTERVAL)
+
+    if flush_now:
+        flush_listens()
+
+
+@atexit.register
+def flush_listens():
+    """Write all buffered listens, one transaction per database
+
+    The buffer is taken under the lock and written after releasing it, so
+    listens logged meanwhile are not held up by the database.
+    """
+    global _flush_timer
+    with _write_lock:
+        with _pending_lock:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+            if not _pending:
+                return
+            rows = list(_pending)
+            _pending.clear()
+
+        by_db = {}
+        for db_path, song_uid, listened_at in rows:
+            by_db.setdefault(db_path, []).append((song_uid, listened_at))
+
+        try:
+            for db_path, db_rows in list(by_db.items()):
+                with _get_connection(db_path) as conn:
+                    # One explicit transaction for the whole batch
+                    conn.execute("BEGIN")
+                    conn.executemany(
+                        "INSERT INTO listen_history (song_uid, listened_at) "
+                        "VALUES (?, ?)",
+                        db_rows,
+                    )
+                    conn.execute("COMMIT")
+                del by_db[db_path]
+        except Exception:
+            # Keep whatever was not written for the next flush
+            with _pending_lock:
+                _pending.extendleft(
+                    reversed([(p, *r) for p, db_rows in by_db.items() for r in db_rows])
+                )
+            raise
+
+
+def _start_flush_timer(delay):
+    """Schedule a background flush in *delay* seconds
+
+    Call with _pending_lock held.
+    """
+    global _flush_timer
+    _flush_timer = threading.Timer(delay, _flush_on_timer, args=(delay,))
+    _flush_timer.daemon = True
+    _flush_timer.start()
+
+
+def _flush_on_timer(delay):
+    """Timer entry point for flush_listens
+
+    A failed write is logged rather than raised, since a traceback from
+    the timer thread would land on the playback screen.  The rows stay
+    buffered and another flush is scheduled, backing off from *delay*.
+    """
+    try:
+        flush_listens()
+    except sqlite3.Error as e:
+        retry = min(delay * 2, _FLUSH_RETRY_MAX)
+        _logger.warning(
+            "Could not write buffered listens, retrying in %.0fs: %s", retry, e
         )
-        conn.commit()
+        with _pending_lock:
+            if _flush_timer is None:
+                _start_flush_timer(retry)
 
 
 def get_top_songs_last_n_days(days, limit=None, reverse=False, db_path=DB_PATH):
@@ -130,7 +391,7 @@ def get_top_songs_this_week(limit=None, reverse=False, db_path=DB_PATH):
 
     return _execute_aggregation_query(
         "WHERE lh.listened_at >= ?",
-        (start_of_week.isoformat(),),
+        (_iso_bound(start_of_week),),
         limit,
         reverse,
         db_path,
@@ -143,7 +404,7 @@ def get_top_songs_this_month(limit=None, reverse=False, db_path=DB_PATH):
 
     return _execute_aggregation_query(
         "WHERE lh.listened_at >= ?",
-        (start_of_month.isoformat(),),
+        (_iso_bound(start_of_month),),
         limit,
         reverse,
         db_path,
@@ -156,7 +417,7 @@ def get_top_songs_this_year(limit=None, reverse=False, db_path=DB_PATH):
 
     return _execute_aggregation_query(
         "WHERE lh.listened_at >= ?",
-        (start_of_year.isoformat(),),
+        (_iso_bound(start_of_year),),
         limit,
         reverse,
         db_path,
@@ -164,8 +425,13 @@ def get_top_songs_this_year(limit=None, reverse=False, db_path=DB_PATH):
 
 
 def get_top_songs_all_time(limit=None, reverse=False, db_path=DB_PATH):
-    """Get songs sorted by listen count for all time"""
-    return _execute_aggregation_query("", (), limit, reverse, db_path)
+    """Get songs sorted by listen count for all time
+
+    Reads the trigger-maintained song_counts table, so the cost does not
+    grow with the length of the history.
+    """
+    query = _all_time_query(reverse, limit is not None)
+    return _fetch_ranking(query, (), limit, db_path)
 
 
 def get_top_songs_for_week(year, week, limit=None, reverse=False, db_path=DB_PATH):
@@ -174,8 +440,8 @@ def get_top_songs_for_week(year, week, limit=None, reverse=False, db_path=DB_PAT
         raise ValueError(f"Week must be between 1 and 53, got: {week}")
 
     return _execute_aggregation_query(
-        "WHERE strftime('%Y', lh.listened_at) = ? AND strftime('%W', lh.listened_at) = ?",
-        (str(year), f"{week:02d}"),
+        "WHERE lh.listened_at >= ? AND lh.listened_at < ?",
+        _week_range(year, week),
         limit,
         reverse,
         db_path,
@@ -188,8 +454,8 @@ def get_top_songs_for_month(year, month, limit=None, reverse=False, db_path=DB_P
         raise ValueError(f"Month must be between 1 and 12, got: {month}")
 
     return _execute_aggregation_query(
-        "WHERE strftime('%Y', lh.listened_at) = ? AND strftime('%m', lh.listened_at) = ?",
-        (str(year), f"{month:02d}"),
+        "WHERE lh.listened_at >= ? AND lh.listened_at < ?",
+        _month_range(year, month),
         limit,
         reverse,
         db_path,
@@ -202,8 +468,8 @@ def get_top_songs_for_year(year, limit=None, reverse=False, db_path=DB_PATH):
         raise ValueError(f"Invalid year: {year}")
 
     return _execute_aggregation_query(
-        "WHERE strftime('%Y', lh.listened_at) = ?",
-        (str(year),),
+        "WHERE lh.listened_at >= ? AND lh.listened_at < ?",
+        _year_range(year),
         limit,
         reverse,
         db_path,
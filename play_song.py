@@ -8,15 +8,32 @@ from URLs, with real-time keyboard controls and a visual progress bar.
 import os
 import subprocess
 import sys
+import textwrap
 import threading
 import time
+from enum import IntEnum
 
 if sys.platform == "win32":
+    import ctypes
     import msvcrt
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    # Declared so 64-bit HANDLEs are not truncated to a C int
+    _kernel32.GetStdHandle.restype = wintypes.HANDLE
+    _kernel32.GetStdHandle.argtypes = (wintypes.DWORD,)
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    _kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    _kernel32.FlushConsoleInputBuffer.restype = wintypes.BOOL
+    _kernel32.FlushConsoleInputBuffer.argtypes = (wintypes.HANDLE,)
+    _STD_INPUT_HANDLE = -10
+    _WAIT_OBJECT_0 = 0
+    _WAIT_TIMEOUT = 0x102
 else:
     import select
     import termios
     import tty
+from functools import lru_cache
 from typing import Optional
 
 import vlc  # type: ignore[import-untyped]
@@ -25,6 +42,102 @@ import constants as cv
 import listen_history
 import playback_timeline
 
+# Playback controls shown under the title (centered)
+_CONTROLS_HEADER = [
+    line.center(cv.SCREEN_WIDTH)
+    for line in (
+        "Space: Play/Pause  S: Stop  R: Restart  G: Prev  H: Next  Q/X: Exit",
+        "A/a: -30s/-5s   D/d: +30s/+5s   0-9: Jump to %",
+    )
+]
+
+
+class PState(IntEnum):
+    """Playback state of the MusicPlayer"""
+
+    PLAYING = 0
+    PAUSED = 1
+    STOPPED = 2
+
+
+# Progress-line status icon for each PState, indexed by state
+_ICONS = ("(>)  ", "(||) ", "([]) ")
+
+# Number of recently played media objects kept for re-visits
+_MEDIA_CACHE_SIZE = 4
+
+# Shortest and longest wait (s) between progress updates; between the two,
+# the loop sleeps until the line can next change.  Key presses cut any
+# wait short
+_TICK_SECONDS = 0.1
+_IDLE_TICK_SECONDS = 1.0
+
+# Longest wait for VLC to start playing a new media (slow network streams)
+_START_TIMEOUT_SECONDS = 2.0
+
+# Playback key codes and the MusicPlayer method (plus arguments) each one
+# calls; keyed by byte value, as iterating the read bytes yields them
+_KEY_ACTIONS = {
+    ord(" "): ("_toggle_play_pause",),  # Space - play/pause
+    ord("a"): ("_seek", -5000),  # Seek back 5s
+    ord("A"): ("_seek", -30000),  # Seek back 30s
+    ord("d"): ("_seek", 5000),  # Seek forward 5s
+    ord("D"): ("_seek", 30000),  # Seek forward 30s
+    # Letters that act the same in either case
+    **{
+        ord(key): action
+        for letter, action in {
+            "s": ("_stop",),  # Stop (reset to beginning)
+            "r": ("_restart",),  # Restart
+            "g": ("_previous_song",),  # Previous song
+            "h": ("_next_song",),  # Next song
+            "q": ("_exit_playback", "skip"),  # Skip to next in queue
+            "x": ("_exit_playback", "abort"),  # Abort entire queue
+        }.items()
+        for key in (letter, letter.upper())
+    },
+    # Digits jump to that decile of the song
+    **{ord(str(digit)): ("_jump_to_percent", digit * 10) for digit in range(10)},
+}
+
+
+if sys.platform == "win32":
+
+    def _read_keys(timeout: float) -> bytes:
+        """Wait up to *timeout* seconds for key presses and return them
+
+        Blocks on the console input handle, so a key is seen as soon as it
+        is pressed.
+        """
+        handle = _kernel32.GetStdHandle(_STD_INPUT_HANDLE)
+        result = _kernel32.WaitForSingleObject(handle, int(timeout * 1000))
+        if result == _WAIT_TIMEOUT:
+            return b""
+        if result != _WAIT_OBJECT_0:
+            time.sleep(timeout)  # Handle not waitable; poll instead
+        elif not msvcrt.kbhit():
+            # Only non-key events (mouse, focus, key-up): discard them or
+            # the handle stays signalled
+            _kernel32.FlushConsoleInputBuffer(handle)
+            return b""
+        keys = []
+        while msvcrt.kbhit():
+            keys.append(msvcrt.getch())
+        return b"".join(keys)
+
+else:
+
+    def _read_keys(timeout: float) -> bytes:
+        """Wait up to *timeout* seconds for key presses and return them
+
+        Expects the terminal in raw mode, so each keystroke arrives
+        without Enter.
+        """
+        fd = sys.stdin.fileno()
+        if not select.select([fd], [], [], timeout)[0]:
+            return b""
+        return os.read(fd, 64)
+
 
 def format_time(seconds: float) -> str:
     """Format seconds as M:SS or H:MM:SS.
@@ -50,14 +163,29 @@ def format_time(seconds: float) -> str:
     return f"{minutes}:{secs:02d}"
 
 
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    """format_time() for whole seconds, cached across progress ticks"""
+    return format_time(seconds)
+
+
+@lru_cache(maxsize=256)
+def _progress_bar(bar_width: int, filled: int) -> str:
+    """Build bar with cursor: ===v---
+
+    Only a bar's worth of distinct cursor positions exist per width, so
+    each is built once and reused for the rest of the session.
+    """
+    return "=" * filled + "v" + "-" * (bar_width - filled - 1)
+
+
 class MusicPlayer:
     """VLC-based music player with keyboard controls"""
 
     def __init__(self):
         self.instance = vlc.Instance()
         self.player = self.instance.media_player_new()
-        self.is_playing = False
-        self.is_stopped = False
+        self.state = PState.STOPPED
         self.should_exit = False
         self.pending_song_uid = None  # Set by G/H navigation for caller to pick up
         self.exit_reason = "ended"  # "ended", "skip" (Q), "abort" (X), "navigate" (G/H)
@@ -66,9 +194,21 @@ class MusicPlayer:
         self.current_song_uid = None
         self.start_time = None
         self.total_played_time = 0  # Track cumulative playback time
-        self.last_duration = 0  # Store duration for display when stopped
+        self.last_duration = 0  # Duration (s) of the current media, once known
         self.listen_log_count = 0  # Track how many times we've logged this song
+        self.next_listen_check = 0.0  # perf_counter() before which no log is due
         self.last_position_ms = 0  # Position (ms) captured when playback exits
+        self.last_progress_key = None  # (icon, pos, dur, filled) on screen
+        self._media_cache = {}  # path_or_url -> vlc.Media, least recent first
+
+        # Set by VLC's event thread once the current media starts (or fails)
+        self.started_event = threading.Event()
+        events = self.player.event_manager()
+        for event_type in (
+            vlc.EventType.MediaPlayerPlaying,
+            vlc.EventType.MediaPlayerEncounteredError,
+        ):
+            events.event_attach(event_type, lambda _event: self.started_event.set())
 
     def play(
         self,
@@ -89,57 +229,85 @@ class MusicPlayer:
         """
         self.current_song_uid = song_uid
         self.should_exit = False
-        self.is_stopped = False
         self.pending_song_uid = None  # Reset for each new song
         self.exit_reason = "ended"  # Reset; overwritten by keyboard or _on_song_end
         self.loop_mode = loop_mode
         self.loop_count = 0
         self.total_played_time = 0
         self.listen_log_count = 0  # Reset log count for new song
-
-        # Create media
-        media = self.instance.media_new(path_or_url)
+        self.next_listen_check = 0.0
+        self.last_duration = 0  # Re-read from the new media
+        self.last_progress_key = None  # New screen, nothing drawn yet
+
+        # Reuse the media when re-visiting a recent song, sparing VLC the
+        # re-open and tag parse
+        media = self._media_cache.pop(path_or_url, None)
+        if media is None:
+            media = self.instance.media_new(path_or_url)
+            if len(self._media_cache) >= _MEDIA_CACHE_SIZE:
+                del self._media_cache[next(iter(self._media_cache))]
+        self._media_cache[path_or_url] = media
         self.player.set_media(media)
 
+        # Get title if not provided (file name for local paths, the URL as-is)
+        if title is None:
+            title = (
+                path_or_url if "://" in path_or_url else os.path.basename(path_or_url)
+            )
+
+        # Show the header right away; VLC opens the media meanwhile
+        self._display_header(title)
+
         # Start playback
+        self.started_event.clear()
         self.player.play()
-        self.is_playing = True
-        self.start_time = time.time()
+        self.state = PState.PLAYING
+        self.start_time = time.perf_counter()
 
-        # Wait for media to parse
-        time.sleep(0.5)
+        # Wait until VLC has opened the media and is actually playing
+        self.started_event.wait(_START_TIMEOUT_SECONDS)
 
         # Seek to resume position if provided
         if start_ms > 0:
             self.player.set_time(start_ms)
 
-        # Get title if not provided
-        if title is None:
-            title = (
-                os.path.basename(path_or_url)
-                if os.path.exists(path_or_url)
-                else path_or_url
-            )
+        # Handle controls until the song ends or is left
+        self._control_playback()
 
-        # Display UI and handle controls
-        self._display_and_control(title)
+    def _control_playback(self):
+        """Run the playback loop, with the terminal in raw mode on POSIX"""
+        if sys.platform == "win32":
+            self._playback_loop()
+        else:
+            # Raw mode delivers single keystrokes without Enter or echo
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            try:
+                tty.setraw(fd)
+                self._playback_loop()
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
-    def _display_and_control(self, title: str):
-        """Display playback UI and handle keyboard controls
+        # Clean up
+        self.player.stop()
+        sys.stdout.write("\r\n")  # Move to new line after progress bar
+        sys.stdout.flush()
 
-        Args:
-            title: Song title to display
-        """
-        # Display UI before starting raw mode keyboard listener
-        self._display_header(title)
+    def _playback_loop(self):
+        """Run playback until the song ends or a key ends it
 
-        # Start keyboard listener thread (sets tty.setraw — must be after header display)
-        keyboard_thread = threading.Thread(target=self._keyboard_listener, daemon=True)
-        keyboard_thread.start()
+        Key presses are read on this thread while waiting between progress
+        updates, so they take effect immediately.
+        """
+        # Hoisted out of the loop, which runs ten times a second
+        get_state = self.player.get_state
+        ended = vlc.State.Ended
+        check_and_log_listen = self._check_and_log_listen
+        update_progress = self._update_progress
+        handle_keys = self._handle_keys
 
-        # Main playback loop
         while not self.should_exit:
-            if self.player.get_state() == vlc.State.Ended:
+            if get_state() == ended:
                 # Song finished naturally
                 self._on_song_end()
                 if self.loop_mode:
@@ -147,38 +315,39 @@ class MusicPlayer:
                     self.loop_count += 1
                     self.total_played_time = 0
                     self.listen_log_count = 0
+                    self.next_listen_check = 0.0
                     self.player.set_time(0)
                     self.player.play()
-                    self.is_playing = True
-                    self.start_time = time.time()
+                    self.state = PState.PLAYING
+                    self.start_time = time.perf_counter()
                     sys.stdout.write(
                         f"\r\n{'[Loop ' + str(self.loop_count + 1) + ']':^{cv.SCREEN_WIDTH}}\r\n"
                     )
                     sys.stdout.flush()
+                    self.last_progress_key = None  # Bar moves to a new row
                     continue
                 break
 
             # Check if we should log a listen (every 70% of duration played)
-            self._check_and_log_listen()
+            check_and_log_listen()
 
-            # Update progress bar
-            self._update_progress()
-
-            time.sleep(0.1)
+            # Update progress bar, then wait for keys until it next changes
+            handle_keys(_read_keys(update_progress()))
 
         # Capture playback position for resume (0 when song ended naturally)
         if self.exit_reason in ("skip", "abort", "navigate"):
             self.last_position_ms = self.player.get_time()
         else:
             self.last_position_ms = 0
-        # Signal keyboard thread to exit and wait for it to restore terminal settings
-        self.should_exit = True
-        keyboard_thread.join(timeout=0.5)
 
-        # Clean up
-        self.player.stop()
-        sys.stdout.write("\r\n")  # Move to new line after progress bar
-        sys.stdout.flush()
+    def _handle_keys(self, keys: bytes):
+        """Apply each key press in *keys*, stopping once one ends playback"""
+        for key in keys:
+            if self.should_exit:
+                break
+            action = _KEY_ACTIONS.get(key)
+            if action:
+                getattr(self, action[0])(*action[1:])
 
     def _display_header(self, title: str):
         """Display centered song title and controls
@@ -188,22 +357,14 @@ class MusicPlayer:
         """
         width = cv.SCREEN_WIDTH
 
-        # Center and wrap title
-        title_lines = self._wrap_text(title, width)
-        for line in title_lines:
-            print(line.center(width))
-
-        print()
-
-        # Display controls (centered)
-        controls = [
-            "Space: Play/Pause  S: Stop  R: Restart  G: Prev  H: Next  Q/X: Exit",
-            "A/a: -30s/-5s   D/d: +30s/+5s   0-9: Jump to %",
-        ]
-        for line in controls:
-            print(line.center(width))
-
-        print()
+        # Center and wrap title, then the controls; the whole header goes
+        # out in a single write
+        lines = [line.center(width) for line in self._wrap_text(title, width)]
+        lines.append("")
+        lines.extend(_CONTROLS_HEADER)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def _wrap_text(self, text: str, width: int) -> list:
         """Wrap text to multiple lines if needed
@@ -218,40 +379,35 @@ class MusicPlayer:
         if len(text) <= width:
             return ["-" * width, text]
 
-        lines = ["-" * width]
-        words = text.split()
-        current_line = ""
-
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            if len(test_line) <= width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+        # Words joined by single spaces, greedily filled; a word longer
+        # than the line is kept whole on its own line
+        return ["-" * width] + textwrap.wrap(
+            " ".join(text.split()),
+            width,
+            break_long_words=False,
+            break_on_hyphens=False,
+        )
 
     def _check_and_log_listen(self):
-        """Check if we've crossed a 70% threshold and log if so"""
+        """Check if we've crossed a 70% threshold and log if so
+
+        Played time advances no faster than the clock, so once a check
+        finds the threshold still ahead, nothing can be due until that much
+        time has passed; calls before then return immediately.
+        """
         if not self.current_song_uid:
             return
 
+        now = time.perf_counter()
+        if now < self.next_listen_check:
+            return
+
         # Get current total played time (including current session if playing)
         current_total = self.total_played_time
-        if self.is_playing and self.start_time:
-            current_total += time.time() - self.start_time
-
-        # Get duration
-        duration = (
-            self.last_duration
-            if self.last_duration > 0
-            else self.player.get_length() / 1000
-        )
+        if self.state == PState.PLAYING and self.start_time is not None:
+            current_total += now - self.start_time
+
+        duration = self._duration()
         if duration <= 0:
             return
 
@@ -260,36 +416,48 @@ class MusicPlayer:
         if current_total >= next_threshold:
             listen_history.log_listen(self.current_song_uid)
             self.listen_log_count += 1
+        else:
+            self.next_listen_check = now + (next_threshold - current_total)
+
+    def _duration(self) -> float:
+        """Return the current media's duration in seconds (0 if not yet known)
+
+        The length is fixed per media, so VLC is only asked until it
+        reports a real value; after that the cached figure is used.
+        """
+        if self.last_duration <= 0:
+            length_ms = self.player.get_length()
+            if length_ms > 0:
+                self.last_duration = length_ms / 1000
+        return self.last_duration
+
+    def _update_progress(self) -> float:
+        """Update progress bar with format: (icon) time====v---- time
+
+        Returns:
+            float: Seconds until the line can next change (the shown second
+            or bar cell advancing, or the song ending), within the tick bounds
+        """
+        state = self.state
+        icon = _ICONS[state]
 
-    def _update_progress(self):
-        """Update progress bar with format: (icon) time====v---- time"""
         # Get duration (use stored if stopped, otherwise from player)
-        if self.is_stopped:
+        if state == PState.STOPPED:
             duration = self.last_duration
             position = 0
-            icon = "([]) "
         else:
-            duration = self.player.get_length() / 1000  # ms to seconds
+            duration = self._duration()
             position = self.player.get_time() / 1000  # ms to seconds
 
-            if duration > 0:
-                self.last_duration = duration  # Store for later use
-
-            # Determine status icon
-            if self.is_playing:
-                icon = "(>)  "
-            else:
-                icon = "(||) "
-
         if duration <= 0:
-            return
+            return _TICK_SECONDS
 
         # Calculate progress
         progress = min(position / duration, 1.0)
 
         # Format time with fixed width (M:SS format, pad to 4 chars)
-        pos_str = format_time(position)
-        dur_str = format_time(duration)
+        pos_str = _format_whole_seconds(int(position))
+        dur_str = _format_whole_seconds(int(duration))
 
         # Calculate bar width based on fixed total width
         # Total: icon(5) + pos_time(4) + bar + dur_time(4) = 80
@@ -298,95 +466,57 @@ class MusicPlayer:
             int(bar_width * progress), bar_width - 1
         )  # ensure v + dashes always fit
 
-        # Build bar with cursor: ===v---
-        bar = "=" * filled + "v" + "-" * (bar_width - filled - 1)
-
-        # Print with carriage return (overwrite same line); \033[K clears to end of line
-        sys.stdout.write(f"\r{icon}{pos_str}{bar}{dur_str}\033[K")
-        sys.stdout.flush()
-
-
-    def _keyboard_listener(self):
-        """Listen for keyboard input in separate thread"""
-        key_actions = {
-            b" ": self._toggle_play_pause,  # Space - play/pause
-            b"s": self._stop,  # Stop (reset to beginning)
-            b"S": self._stop,
-            b"r": self._restart,  # Restart
-            b"R": self._restart,
-            b"g": self._previous_song,  # Previous song
-            b"G": self._previous_song,
-            b"h": self._next_song,  # Next song
-            b"H": self._next_song,
-            b"a": lambda: self._seek(-5000),  # Seek back 5s
-            b"A": lambda: self._seek(-30000),  # Seek back 30s
-            b"d": lambda: self._seek(5000),  # Seek forward 5s
-            b"D": lambda: self._seek(30000),  # Seek forward 30s
-        }
-        exit_keys = {
-            b"q": "skip",  # Skip to next in queue
-            b"Q": "skip",
-            b"x": "abort",  # Abort entire queue
-            b"X": "abort",
-        }
-
-        if sys.platform == "win32":
-            while not self.should_exit:
-                if msvcrt.kbhit():
-                    char = msvcrt.getch()
-                    if char in key_actions:
-                        key_actions[char]()
-                    elif char in exit_keys:
-                        self.exit_reason = exit_keys[char]
-                        self.should_exit = True
-                    elif char.isdigit():  # Jump to decile
-                        self._jump_to_percent(int(char) * 10)
-                time.sleep(0.01)
-        else:
-            fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(fd)
-                while not self.should_exit:
-                    if select.select([sys.stdin], [], [], 0.01)[0]:
-                        char = sys.stdin.read(1)
-                        char_bytes = char.encode()
-
-                        if char_bytes in key_actions:
-                            key_actions[char_bytes]()
-                        elif char_bytes in exit_keys:
-                            self.exit_reason = exit_keys[char_bytes]
-                            self.should_exit = True
-                        elif char.isdigit():  # Jump to decile
-                            self._jump_to_percent(int(char) * 10)
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        # Most ticks land inside the same second and bar cell, leaving the
+        # line unchanged; only build and write it when one of its parts differs
+        key = (icon, pos_str, dur_str, filled)
+        if key != self.last_progress_key:
+            self.last_progress_key = key
+
+            bar = _progress_bar(bar_width, filled)
+            line = f"\r{icon}{pos_str}{bar}{dur_str}"
+
+            # Print with carriage return (overwrite same line).  The bar
+            # absorbs any change in the time strings' lengths, so every line
+            # is exactly SCREEN_WIDTH wide and fully covers the previous one
+            # without \033[K.  The line is plain ASCII and goes straight to
+            # the descriptor in one write, skipping the text layer's
+            # encode-and-buffer round trip
+            os.write(sys.stdout.fileno(), line.encode("ascii"))
+
+        # Paused or stopped, only a key press changes anything
+        if state != PState.PLAYING:
+            return _IDLE_TICK_SECONDS
+        cell = duration / bar_width
+        wait = min(1 - position % 1, cell - position % cell, duration - position)
+        return min(max(wait, _TICK_SECONDS), _IDLE_TICK_SECONDS)
+
+
+    def _exit_playback(self, reason: str):
+        """Leave playback, recording *reason* as the exit reason"""
+        self.exit_reason = reason
+        self.should_exit = True
 
     def _toggle_play_pause(self):
         """Toggle between play and pause"""
-        # Don't allow resume if stopped
-        if self.is_stopped:
-            return
-
-        if self.is_playing:
+        if self.state == PState.PLAYING:
             # Track time before pausing
-            if self.start_time:
-                self.total_played_time += time.time() - self.start_time
+            if self.start_time is not None:
+                self.total_played_time += time.perf_counter() - self.start_time
                 self.start_time = None
             self.player.pause()
-            self.is_playing = False
-        else:
+            self.state = PState.PAUSED
+        elif self.state == PState.PAUSED:
             self.player.play()
-            self.is_playing = True
-            self.start_time = time.time()
+            self.state = PState.PLAYING
+            self.start_time = time.perf_counter()
+        # Don't allow resume if stopped
 
     def _stop(self):
         """Stop playback and reset to beginning"""
         self.player.stop()
-        self.is_playing = False
-        self.is_stopped = True
-        if self.start_time:
-            self.total_played_time += time.time() - self.start_time
+        self.state = PState.STOPPED
+        if self.start_time is not None:
+            self.total_played_time += time.perf_counter() - self.start_time
             self.start_time = None
         # Force immediate display update to show stop icon and cursor at start
         self._update_progress()
@@ -394,11 +524,10 @@ class MusicPlayer:
     def _restart(self):
         """Restart current song from beginning"""
         self.player.set_time(0)
-        if not self.is_playing:
+        if self.state != PState.PLAYING:
             self.player.play()
-            self.is_playing = True
-            self.is_stopped = False
-            self.start_time = time.time()
+            self.state = PState.PLAYING
+            self.start_time = time.perf_counter()
 
     def _previous_song(self):
         """Skip to previous song in playback timeline"""
@@ -423,7 +552,7 @@ class MusicPlayer:
             milliseconds: Amount to seek (positive = forward, negative = backward)
         """
         current_time = self.player.get_time()
-        duration = self.player.get_length()
+        duration = int(self._duration() * 1000)
         new_time = max(0, current_time + milliseconds)
         if duration > 0:
             new_time = min(new_time, duration - 1000)  # 1 second buffer before end
@@ -441,8 +570,8 @@ class MusicPlayer:
     def _on_song_end(self):
         """Handle song ending naturally"""
         # Track final play time
-        if self.start_time:
-            self.total_played_time += time.time() - self.start_time
+        if self.start_time is not None:
+            self.total_played_time += time.perf_counter() - self.start_time
             self.start_time = None
 
         # Final check for any remaining log threshold
@@ -515,24 +644,25 @@ def stream_from_url(url: str):
     Args:
         url: URL to stream from
     """
-    # Use yt-dlp to get the direct stream URL
+    # Use yt-dlp to get the direct stream URL and the title for display in
+    # one run, so the video is only resolved once
     try:
         result = subprocess.run(
-            [*cv.YT_DLP_CMD, "-f", "bestaudio", "--get-url", url],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        direct_url = result.stdout.strip()
-
-        # Get title for display
-        title_result = subprocess.run(
-            [*cv.YT_DLP_CMD, "--get-title", url],
+            [
+                *cv.YT_DLP_CMD,
+                "-f",
+                "bestaudio",
+                "--print",
+                "urls",
+                "--print",
+                "title",
+                url,
+            ],
             capture_output=True,
             text=True,
             check=True,
         )
-        title = title_result.stdout.strip()
+        direct_url, _, title = result.stdout.strip().partition("\n")
 
         # Play the direct stream URL
         _player.play(direct_url, song_uid=None, title=title)
@@ -23,6 +23,20 @@ from song_metadata import get_song as _get_song
 DB_PATH = cv.DB_PATH
 MAX_PAST_ENTRIES = 100
 
+# Bumped by every write that can change the current song or its resume point
+_timeline_version = 0
+
+
+def _bump_timeline_version():
+    """Signal that the current song or resume position may have changed"""
+    global _timeline_version
+    _timeline_version += 1
+
+
+def get_timeline_version():
+    """Return a counter that increases whenever the current song state changes"""
+    return _timeline_version
+
 
 def init_database(db_path=DB_PATH):
     """Create playback timeline tables if they don't exist"""
@@ -80,6 +94,8 @@ def init_database(db_path=DB_PATH):
 
         conn.commit()
 
+    _bump_timeline_version()
+
     return db_path
 
 
@@ -104,6 +120,8 @@ def _set_cursor(position, db_path=DB_PATH):
         )
         conn.commit()
 
+    _bump_timeline_version()
+
 
 def get_resume_ms(db_path=DB_PATH):
     """Return the saved resume position (ms) for the current song, or 0."""
@@ -124,6 +142,8 @@ def set_resume_ms(ms, db_path=DB_PATH):
         )
         conn.commit()
 
+    _bump_timeline_version()
+
 
 def get_current_song(db_path=DB_PATH):
     """Get the song_uid at the current cursor position, or None if empty/invalid"""
@@ -166,6 +186,8 @@ def clear_timeline(db_path=DB_PATH):
         cursor.execute("UPDATE playback_cursor SET position = -1 WHERE id = 1")
         conn.commit()
 
+    _bump_timeline_version()
+
 
 def skip_back(db_path=DB_PATH):
     """
@@ -371,6 +393,8 @@ def _renumber_positions(db_path=DB_PATH):
 
         conn.commit()
 
+    _bump_timeline_version()
+
 
 def _prune_past(limit=MAX_PAST_ENTRIES, db_path=DB_PATH):
     """Delete oldest past entries if count exceeds limit, then renumber"""
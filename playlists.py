@@ -84,7 +84,8 @@ def _renumber_positions(
     """Renumber playlist positions to be consecutive starting from 1"""
     should_close = conn is None
     if conn is None:
-        conn = _get_connection(db_path).__enter__()
+        connection = _get_connection(db_path)
+        conn = connection.__enter__()
 
     try:
         cursor = conn.cursor()
@@ -124,14 +125,15 @@ def _renumber_positions(
             conn.commit()
     finally:
         if should_close:
-            conn.__exit__(None, None, None)
+            connection.__exit__(None, None, None)
 
 
 def _update_modified_time(playlist_uid, conn=None, db_path=DB_PATH):
     """Update last_modified timestamp for a playlist"""
     should_close = conn is None
     if conn is None:
-        conn = _get_connection(db_path).__enter__()
+        connection = _get_connection(db_path)
+        conn = connection.__enter__()
 
     try:
         cursor = conn.cursor()
@@ -147,7 +149,7 @@ def _update_modified_time(playlist_uid, conn=None, db_path=DB_PATH):
             conn.commit()
     finally:
         if should_close:
-            conn.__exit__(None, None, None)
+            connection.__exit__(None, None, None)
 
 
 # ============================================================================
@@ -877,6 +879,32 @@ def get_playlist_stats(playlist_uid, db_path=DB_PATH):
     }
 
 
+def get_all_playlist_stats(db_path=DB_PATH):
+    """Get song count and total duration for every non-empty playlist at once
+
+    Args:
+        db_path: Path to database
+
+    Returns:
+        Dict mapping playlist UID to a dict with song_count and
+        total_duration.  Empty playlists are absent.
+    """
+    with _get_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT pi.playlist_uid, COUNT(*), SUM(s.duration)
+            FROM playlist_items pi
+            LEFT JOIN songs s ON pi.song_uid = s.uid
+            GROUP BY pi.playlist_uid
+        """
+        )
+        return {
+            row[0]: {"song_count": row[1], "total_duration": row[2] or 0}
+            for row in cursor.fetchall()
+        }
+
+
 def merge_playlists(source_uid, target_uid, db_path=DB_PATH):
     """Append all songs from source playlist to target playlist
 
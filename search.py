@@ -7,20 +7,48 @@ Algorithm (adapted from the original pandas-based implementation):
      matches "dark side" etc.
   2. For every (query_token, title_token) pair, compute the Levenshtein
      distance.  If a query token is an exact substring of the title the pair
-     scores 1 (very close match).
+     scores 1 (very close match).  Distances come from rapidfuzz, whose C++
+     kernel is already bit-parallel (Myers/Hyyrö: one machine word per
+     column for tokens up to 64 characters, blocked beyond that), so there
+     is no Python DP here to optimise — only the number of calls.
   3. Collect the N smallest distances and use that sorted tuple as the sort key
      for the whole song list.  Shorter distance lists rank higher; Python's
      tuple comparison does the right thing.
   4. Return the top ``limit`` songs.
 
+Fast path: when at least ``limit`` titles contain the query verbatim
+(case-insensitive), those are ranked by where the match occurs and returned
+directly — whole-word matches first, then word-start matches, then any other
+substring, earlier matches before later ones — without computing a single
+edit distance.  Candidates for the substring test come from a character
+bigram index over the song list, built once per list and reused until the
+library (and therefore the list object) changes.
+
 No pandas required — operates directly on the list-of-dicts produced by
 song_metadata.get_songs_alphabetically() and friends.
 """
 
 import re
+from bisect import insort
+from functools import lru_cache
 
 from rapidfuzz.distance import Levenshtein
 
+# Number of distinct titles whose tokens are kept between searches
+_TITLE_CACHE_SIZE = 16384
+
+# Number of query tokens whose distance tables are kept between searches
+_QUERY_CACHE_SIZE = 32
+
+# Distances from each recent query token to the title tokens scored against
+# it, least recently used first: query_token -> {title_token: distance}
+_distance_tables: dict[str, dict[str, int]] = {}
+
+# Bigram index for the most recently searched song list: (songs, postings),
+# where postings maps each lowercased character pair to the ascending
+# positions of the titles containing it
+_index: tuple[list[dict], dict[str, list[int]]] | None = None
+
 # ---------------------------------------------------------------------------
 # Character normalisation map (Hungarian diacritics → ASCII equivalents)
 # ---------------------------------------------------------------------------
@@ -67,26 +95,132 @@ def tokenize_neighbor(text: str) -> list[str]:
     return tokens + neighbor_tokens
 
 
-def _token_distance(query: str, title: str, depth: int = 6) -> list[int]:
+@lru_cache(maxsize=_TITLE_CACHE_SIZE)
+def _title_terms(title: str) -> tuple[str, tuple[str, ...]]:
+    """Return the lowercased *title* and its neighbour tokens.
+
+    Titles rarely change, so this is cached across searches and every
+    query after the first skips the normalisation work entirely.
+    """
+    return title.lower(), tuple(tokenize_neighbor(title))
+
+
+def _distance_table(query_token: str) -> dict[str, int]:
+    """Return the shared table of distances from *query_token* to title tokens.
+
+    The table starts empty and is filled in by ``_token_distance``.  It
+    outlives the search that created it, so refining a query ("love" →
+    "love me do") or repeating one only scores the tokens that are new.
+    Distances depend on the two strings alone, so library changes never
+    make an entry stale.  Only the ``_QUERY_CACHE_SIZE`` most recently
+    used tokens keep their tables; older ones are rebuilt if needed again.
+    """
+    table = _distance_tables.pop(query_token, None)
+    if table is None:
+        table = {}
+        if len(_distance_tables) >= _QUERY_CACHE_SIZE:
+            del _distance_tables[next(iter(_distance_tables))]
+    _distance_tables[query_token] = table
+    return table
+
+
+def build_index(songs: list[dict]) -> dict[str, list[int]]:
+    """Index *songs* by the character bigrams of their lowercased titles.
+
+    ``fuzzy_search`` calls this lazily whenever it is handed a different
+    list; calling it up front just moves that cost out of the first search.
+
+    Returns:
+        The bigram postings, also kept as the module's current index.
+    """
+    global _index
+    postings: dict[str, list[int]] = {}
+    for i, song in enumerate(songs):
+        title_lower = _title_terms(song.get("title", ""))[0]
+        for bigram in {title_lower[j : j + 2] for j in range(len(title_lower) - 1)}:
+            postings.setdefault(bigram, []).append(i)
+    _index = (songs, postings)
+    return postings
+
+
+def _substring_hits(query_lower: str, songs: list[dict]) -> list[dict]:
+    """Return the songs whose lowercased title contains *query_lower*, in order.
+
+    Only titles listed under the query's rarest bigram are tested, since a
+    title containing the query must contain every one of its bigrams.
+    """
+    if len(query_lower) < 2:
+        return [s for s in songs if query_lower in _title_terms(s.get("title", ""))[0]]
+
+    if _index is not None and _index[0] is songs:
+        postings = _index[1]
+    else:
+        postings = build_index(songs)
+    candidates = min(
+        (postings.get(query_lower[j : j + 2], []) for j in range(len(query_lower) - 1)),
+        key=len,
+    )
+    return [
+        songs[i]
+        for i in candidates
+        if query_lower in _title_terms(songs[i].get("title", ""))[0]
+    ]
+
+
+def _token_distance(
+    query_terms: list[tuple[str, dict[str, int]]], title: str, depth: int = 6
+) -> list[int]:
     """Return the *depth* smallest Levenshtein distances between all
     (query_token, title_token) pairs.
 
     An exact substring match scores 1 (better than most near-matches but
     worse than an identical token pair which scores 0).
+
+    *query_terms* pairs each query token with its table of distances already
+    computed against title tokens.  Titles share most of their words, so
+    each distinct pair is scored once and looked up afterwards.
+    Once *depth* distances are known, a pair whose length difference
+    already reaches the worst of them cannot improve the result and is
+    skipped.  The result is identical to scoring every pair.
     """
-    query_tokens = tokenize_neighbor(query)
-    title_lower = title.lower()
-    title_tokens = tokenize_neighbor(title)
+    if depth <= 0:
+        return []
 
-    distances: list[int] = []
-    for qt in query_tokens:
+    title_lower, title_tokens = _title_terms(title)
+
+    best: list[int] = []  # ascending, at most *depth* entries
+    for qt, distances in query_terms:
         if qt in title_lower:
-            distances.append(1)  # substring hit — strong signal
+            insort(best, 1)  # substring hit — strong signal
+            del best[depth:]
         for tt in title_tokens:
-            distances.append(Levenshtein.distance(qt, tt))
+            full = len(best) == depth
+            if full and abs(len(qt) - len(tt)) >= best[-1]:
+                continue  # length difference is a lower bound on the distance
+            dist = distances.get(tt)
+            if dist is None:
+                dist = distances[tt] = Levenshtein.distance(qt, tt)
+            if not full:
+                insort(best, dist)
+            elif dist < best[-1]:
+                best.pop()
+                insort(best, dist)
+
+    return best
 
-    distances.sort()
-    return distances[:depth]
+
+def _substring_rank(query_lower: str, title: str) -> tuple[bool, bool, int, int]:
+    """Sort key for a title known to contain *query_lower*.
+
+    Matches starting a word rank first (whole words before partial ones),
+    then earlier matches, then shorter titles.
+    """
+    title_lower = _title_terms(title)[0]
+    pos = title_lower.find(query_lower)
+    end = pos + len(query_lower)
+    word_start = pos == 0 or not title_lower[pos - 1].isalnum()
+    word_end = end == len(title_lower) or not title_lower[end].isalnum()
+    return (not word_start, not word_end, pos, len(title_lower))
 
 
 def fuzzy_search(
@@ -112,8 +246,17 @@ def fuzzy_search(
     if not query or not songs:
         return []
 
+    # Fast path: enough verbatim substring hits, no edit distance needed
+    query_lower = query.strip().lower()
+    if query_lower:
+        hits = _substring_hits(query_lower, songs)
+        if len(hits) >= limit:
+            hits.sort(key=lambda s: _substring_rank(query_lower, s.get("title", "")))
+            return hits[:limit]
+
+    query_terms = [(qt, _distance_table(qt)) for qt in tokenize_neighbor(query)]
     scored = sorted(
         songs,
-        key=lambda s: _token_distance(query, s.get("title", ""), depth),
+        key=lambda s: _token_distance(query_terms, s.get("title", ""), depth),
     )
     return scored[:limit]
@@ -9,6 +9,7 @@ import os
 from datetime import datetime
 
 import constants as cv
+import listen_history
 import reader
 from db_utils import get_connection as _get_connection
 from db_utils import row_to_song_dict as _row_to_song_dict
@@ -18,6 +19,28 @@ from db_utils import validate_uid as _validate_uid
 # Constants
 DB_PATH = cv.DB_PATH
 
+# Maximum number of UIDs bound into a single IN (...) lookup
+_IN_BATCH_SIZE = 500
+
+# Cached alphabetical song lists, keyed by (db_path, reverse).  Each entry
+# stores the library version it was built at; any write to the songs table
+# bumps the version so the next read rebuilds the list.
+_library_version = 0
+_alpha_cache = {}
+# uid -> 1-based alphabetical position, keyed by db_path, versioned the same way
+_alpha_index_cache = {}
+
+
+def _bump_library_version():
+    """Invalidate cached song lists after the songs table was modified"""
+    global _library_version
+    _library_version += 1
+
+
+def get_library_version():
+    """Return a counter that increases every time the song library changes"""
+    return _library_version
+
 
 def resolve_path(filename):
     """Resolve a song filename to its full absolute path.
@@ -75,6 +98,7 @@ def init_database(db_path=DB_PATH):
 
     # Migrate any legacy full paths to bare filenames
     _migrate_paths_to_filenames(db_path)
+    _bump_library_version()
 
     return db_path
 
@@ -143,6 +167,8 @@ def add_song(uid, title, path, url=None, duration=None, add_date=None, db_path=D
         )
         conn.commit()
 
+    _bump_library_version()
+
     return uid
 
 
@@ -161,6 +187,33 @@ def get_song(uid, db_path=DB_PATH):
         return _row_to_song_dict(row) if row else None
 
 
+def get_songs(uids, db_path=DB_PATH):
+    """Get metadata for many songs at once, returns dict of uid -> song dict
+
+    UIDs not in the library are absent from the result.  Lookups are
+    batched into IN (...) queries so the statement stays under SQLite's
+    bound-parameter limit.
+    """
+    uids = list(dict.fromkeys(uids))
+    songs = {}
+    with _get_connection(db_path) as conn:
+        cursor = conn.cursor()
+        for start in range(0, len(uids), _IN_BATCH_SIZE):
+            batch = uids[start : start + _IN_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            cursor.execute(
+                f"""
+                SELECT uid, title, url, duration, add_date, path, last_modified
+                FROM songs WHERE uid IN ({placeholders})
+            """,
+                batch,
+            )
+            for row in cursor.fetchall():
+                song = _row_to_song_dict(row)
+                songs[song["uid"]] = song
+    return songs
+
+
 def get_song_by_url(url, db_path=DB_PATH):
     """Get song metadata by URL, returns dict or None"""
     with _get_connection(db_path) as conn:
@@ -190,6 +243,31 @@ def get_all_songs(db_path=DB_PATH):
         return [_row_to_song_dict(row) for row in cursor.fetchall()]
 
 
+def get_songs_by_date(newest_first=True, limit=None, offset=0, db_path=DB_PATH):
+    """Get songs ordered by add_date, sorted and optionally paged in SQL
+
+    Args:
+        newest_first: True for most recent first, False for oldest first
+        limit: Maximum number of songs to return (None = all)
+        offset: Number of songs to skip from the start of the ordering
+        db_path: Path to database file
+    """
+    order = "DESC" if newest_first else "ASC"
+    query = f"""
+        SELECT uid, title, url, duration, add_date, path, last_modified
+        FROM songs
+        ORDER BY add_date {order}
+    """
+    params = ()
+    if limit is not None or offset:
+        query += " LIMIT ? OFFSET ?"
+        params = (-1 if limit is None else limit, offset)
+    with _get_connection(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        return [_row_to_song_dict(row) for row in cursor.fetchall()]
+
+
 def search_songs(query, db_path=DB_PATH):
     """Search songs by title (LIKE query), returns list"""
     with _get_connection(db_path) as conn:
@@ -220,6 +298,8 @@ def update_song_path(uid, new_path, db_path=DB_PATH):
         )
         conn.commit()
 
+    _bump_library_version()
+
 
 def update_song_title(uid, new_title, db_path=DB_PATH):
     """Update song title (database only, does not rename file)
@@ -241,6 +321,8 @@ def update_song_title(uid, new_title, db_path=DB_PATH):
         )
         conn.commit()
 
+    _bump_library_version()
+
 
 def update_song_duration(uid, new_duration, db_path=DB_PATH):
     """Update song duration
@@ -262,6 +344,8 @@ def update_song_duration(uid, new_duration, db_path=DB_PATH):
         )
         conn.commit()
 
+    _bump_library_version()
+
 
 def delete_song(uid, db_path=DB_PATH):
     """Delete song by UID (does not delete listen history)"""
@@ -270,9 +354,23 @@ def delete_song(uid, db_path=DB_PATH):
         cursor.execute("DELETE FROM songs WHERE uid = ?", (uid,))
         conn.commit()
 
+    _bump_library_version()
+
 
 def get_songs_alphabetically(reverse=False, db_path=DB_PATH):
-    """Get all songs sorted alphabetically by title"""
+    """Get all songs sorted alphabetically by title
+
+    The list is cached until the library is next modified, so repeated calls
+    are O(1).  The returned list and its dicts are shared between callers:
+    do not reorder the list or change the stored fields.  Callers may add
+    underscore-prefixed keys memoizing values derived from a song (the CLI
+    keeps ``_full_path`` there); they are discarded with the cached list.
+    """
+    key = (db_path, reverse)
+    cached = _alpha_cache.get(key)
+    if cached and cached[0] == _library_version:
+        return cached[1]
+
     order = "DESC" if reverse else "ASC"
     with _get_connection(db_path) as conn:
         cursor = conn.cursor()
@@ -283,11 +381,33 @@ def get_songs_alphabetically(reverse=False, db_path=DB_PATH):
             ORDER BY title {order}
         """
         )
-        return [_row_to_song_dict(row) for row in cursor.fetchall()]
+        songs = [_row_to_song_dict(row) for row in cursor.fetchall()]
+
+    _alpha_cache[key] = (_library_version, songs)
+    return songs
+
+
+def get_alpha_index_map(db_path=DB_PATH):
+    """Map each song UID to its 1-based position in the alphabetical list
+
+    Built from get_songs_alphabetically() and cached until the library is
+    next modified.  The returned dict is shared between callers — do not
+    mutate it.
+    """
+    cached = _alpha_index_cache.get(db_path)
+    if cached and cached[0] == _library_version:
+        return cached[1]
+
+    songs = get_songs_alphabetically(db_path=db_path)
+    index = {song["uid"]: i for i, song in enumerate(songs, 1)}
+    _alpha_index_cache[db_path] = (_library_version, index)
+    return index
 
 
 def get_songs_with_listen_count(limit=None, db_path=DB_PATH):
     """Get all songs with their total listen count"""
+    # Count listens still buffered by log_listen too
+    listen_history.flush_listens()
     with _get_connection(db_path) as conn:
         cursor = conn.cursor()
         query = """
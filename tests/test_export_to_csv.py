@@ -1,6 +1,7 @@
 """Tests for export_to_csv module"""
 
 import csv
+import gzip
 import os
 import sqlite3
 import tempfile
@@ -247,6 +248,26 @@ def test_csv_encoding_with_unicode(temp_db, temp_output_dir, monkeypatch):
     assert "Café ☕ 日本語" in unicode_row[0][1]
 
 
+def test_export_all_tables_compressed(temp_db, temp_output_dir, monkeypatch):
+    """Test that compress=True writes readable .csv.gz files"""
+    monkeypatch.setattr(export_to_csv, "DB_PATH", temp_db)
+    monkeypatch.setattr(export_to_csv, "OUTPUT_DIR", temp_output_dir)
+
+    export_to_csv.export_all_tables(compress=True)
+
+    files = sorted(os.listdir(temp_output_dir))
+    assert len(files) == 2
+    assert all(f.endswith(".csv.gz") for f in files)
+
+    songs_file = [f for f in files if f.startswith("songs_")][0]
+    with gzip.open(
+        os.path.join(temp_output_dir, songs_file), "rt", encoding="utf-8"
+    ) as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["uid", "title", "url", "duration", "add_date", "path"]
+    assert len(rows) == 3
+
+
 def test_output_directory_creation(temp_db, monkeypatch):
     """Test that export_all_tables creates output directory if it doesn't exist"""
     monkeypatch.setattr(export_to_csv, "DB_PATH", temp_db)
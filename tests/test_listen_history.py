@@ -1,11 +1,13 @@
 import os
+import shutil
 import sqlite3
 import tempfile
 import unittest
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import listen_history
+from db_utils import close_connections
 
 
 class TestListenHistory(unittest.TestCase):
@@ -20,6 +22,8 @@ class TestListenHistory(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary database"""
+        listen_history.flush_listens()
+        close_connections()
         if os.path.exists(self.db_path):
             os.unlink(self.db_path)
 
@@ -88,7 +92,27 @@ class TestDatabaseInitialization(TestListenHistory):
         conn.close()
 
         self.assertIn("idx_song_uid", indexes)
-        self.assertIn("idx_listened_at", indexes)
+        self.assertIn("idx_listened_at_song_uid", indexes)
+        # The covering index replaces the plain listened_at one
+        self.assertNotIn("idx_listened_at", indexes)
+
+    def test_init_database_backfills_song_counts(self):
+        """Test that counts are rebuilt for a history without song_counts"""
+        self._insert_test_data(
+            [("backfill00000001", datetime.now())] * 3
+            + [("backfill00000002", datetime.now())]
+        )
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DROP TABLE song_counts")
+        conn.commit()
+        conn.close()
+
+        listen_history.init_database(self.db_path)
+        self._insert_test_data([("backfill00000002", datetime.now())])
+
+        result = listen_history.get_top_songs_all_time(db_path=self.db_path)
+        counts = {row["uid"]: row["listen_count"] for row in result}
+        self.assertEqual(counts, {"backfill00000001": 3, "backfill00000002": 2})
 
     def test_init_database_creates_directory(self):
         """Test that init_database creates parent directory if needed"""
@@ -100,6 +124,7 @@ class TestDatabaseInitialization(TestListenHistory):
             listen_history.init_database(nested_path)
             self.assertTrue(os.path.exists(nested_path))
         finally:
+            close_connections()
             if os.path.exists(nested_path):
                 os.unlink(nested_path)
             # Clean up directories
@@ -118,6 +143,7 @@ class TestLogListen(TestListenHistory):
         """Test logging a listen with valid song UID"""
         song_uid = "abcd1234EFGH5678"
         listen_history.log_listen(song_uid, self.db_path)
+        listen_history.flush_listens()
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -160,6 +186,7 @@ class TestLogListen(TestListenHistory):
         before = datetime.now()
         listen_history.log_listen(song_uid, self.db_path)
         after = datetime.now()
+        listen_history.flush_listens()
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
@@ -173,6 +200,68 @@ class TestLogListen(TestListenHistory):
         self.assertGreaterEqual(timestamp, before)
         self.assertLessEqual(timestamp, after)
 
+    def test_log_listen_buffered_until_flush(self):
+        """Test that listens are written on flush and visible to queries"""
+        song_uid = "buff1234ABCD5678"
+        listen_history.log_listen(song_uid, self.db_path)
+        listen_history.log_listen(song_uid, self.db_path)
+
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM listen_history").fetchone()[0]
+        conn.close()
+        self.assertEqual(count, 0)
+
+        # Queries flush pending listens first
+        result = listen_history.get_top_songs_all_time(db_path=self.db_path)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]["listen_count"], 2)
+
+    @patch("listen_history._FLUSH_INTERVAL", 0.01)
+    def test_timer_flush_writes_listens(self):
+        """Test that each timer flush writes the listens logged before it"""
+        song_uid = "timer234ABCD5678"
+
+        for _ in range(2):
+            listen_history.log_listen(song_uid, self.db_path)
+            timer = listen_history._flush_timer
+            timer.join(timeout=5)
+            self.assertFalse(timer.is_alive())
+
+        conn = sqlite3.connect(self.db_path)
+        count = conn.execute("SELECT COUNT(*) FROM listen_history").fetchone()[0]
+        conn.close()
+        self.assertEqual(count, 2)
+
+    @patch("listen_history._FLUSH_INTERVAL", 0.1)
+    def test_timer_flush_failure_retries(self):
+        """Test that a failed timer flush logs, keeps rows and retries later"""
+        song_uid = "fail1234ABCD5678"
+        temp_dir = tempfile.mkdtemp()
+        missing_db = os.path.join(temp_dir, "missing", "listens.db")
+        listen_history.log_listen(song_uid, missing_db)
+
+        with self.assertLogs("listen_history", level="WARNING"):
+            listen_history._flush_timer.join(timeout=5)
+
+        self.assertEqual(list(listen_history._pending), [(missing_db, song_uid, ANY)])
+        retry_timer = listen_history._flush_timer
+        self.assertEqual(retry_timer.args, (0.2,))
+
+        try:
+            # The retry succeeds once the database exists
+            listen_history.init_database(missing_db)
+            retry_timer.join(timeout=5)
+            self.assertEqual(list(listen_history._pending), [])
+
+            conn = sqlite3.connect(missing_db)
+            count = conn.execute("SELECT COUNT(*) FROM listen_history").fetchone()[0]
+            conn.close()
+            self.assertEqual(count, 1)
+        finally:
+            listen_history._pending.clear()
+            close_connections()
+            shutil.rmtree(temp_dir)
+
 
 class TestHelperFunctions(unittest.TestCase):
     """Tests for internal helper functions"""
@@ -626,6 +715,7 @@ class TestConnectionContextManager(unittest.TestCase):
             del cursor, conn
             import gc
             gc.collect()
+            close_connections()
             if os.path.exists(db_path):
                 os.unlink(db_path)
 
@@ -643,6 +733,33 @@ class TestConnectionContextManager(unittest.TestCase):
                     cursor = conn.cursor()
                     cursor.execute("SELECT * FROM nonexistent_table")
         finally:
+            close_connections()
+            if os.path.exists(db_path):
+                os.unlink(db_path)
+
+    def test_connection_reused_and_rolled_back(self):
+        """Test that a released connection is reused without pending changes"""
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_db.close()
+        db_path = temp_db.name
+
+        try:
+            listen_history.init_database(db_path)
+
+            with listen_history._get_connection(db_path) as first:
+                first.execute(
+                    "INSERT INTO listen_history (song_uid, listened_at) VALUES (?, ?)",
+                    ("songUNCOMMITTED1", datetime.now().isoformat()),
+                )
+            with listen_history._get_connection(db_path) as second:
+                count = second.execute(
+                    "SELECT COUNT(*) FROM listen_history"
+                ).fetchone()[0]
+
+            self.assertIs(first, second)
+            self.assertEqual(count, 0)
+        finally:
+            close_connections()
             if os.path.exists(db_path):
                 os.unlink(db_path)
 
@@ -6,6 +6,7 @@ import tempfile
 import unittest
 
 import playlists
+from db_utils import close_connections
 
 
 class TestPlaylists(unittest.TestCase):
@@ -38,6 +39,7 @@ class TestPlaylists(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary database"""
+        close_connections()
         if os.path.exists(self.db_path):
             os.unlink(self.db_path)
 
@@ -335,6 +337,24 @@ class TestQueryFunctions(TestPlaylists):
         self.assertEqual(len(empty), 1)
         self.assertEqual(empty[0]["name"], "Empty")
 
+    def test_get_all_playlist_stats(self):
+        """Test per-playlist counts and durations from a single query"""
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(
+            "INSERT INTO songs (uid, title, duration) VALUES (?, ?, ?)",
+            [("song1234ABCD5678", "A", 100), ("song8765DCBA4321", "B", 50)],
+        )
+        conn.commit()
+        conn.close()
+        empty_uid = playlists.create_playlist("Empty", db_path=self.db_path)
+        uid = playlists.create_playlist("Full", db_path=self.db_path)
+        playlists.add_to_playlist(uid, "song1234ABCD5678", self.db_path)
+        playlists.add_to_playlist(uid, "song8765DCBA4321", self.db_path)
+
+        stats = playlists.get_all_playlist_stats(self.db_path)
+        self.assertNotIn(empty_uid, stats)
+        self.assertEqual(stats[uid], {"song_count": 2, "total_duration": 150})
+
 
 class TestInputValidation(TestPlaylists):
     """Tests for input validation"""
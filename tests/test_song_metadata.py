@@ -6,7 +6,9 @@ import tempfile
 import unittest
 from datetime import datetime
 
+import listen_history
 import song_metadata
+from db_utils import close_connections
 
 
 class TestSongMetadata(unittest.TestCase):
@@ -21,6 +23,7 @@ class TestSongMetadata(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temporary database"""
+        close_connections()
         if os.path.exists(self.db_path):
             os.unlink(self.db_path)
 
@@ -144,6 +147,19 @@ class TestGetSong(TestSongMetadata):
         song = song_metadata.get_song("songNONEABCD5678", self.db_path)
         self.assertIsNone(song)
 
+    def test_get_songs_batch(self):
+        """Test fetching several songs at once, skipping unknown UIDs"""
+        song_metadata.add_song("song1111AAAA1111", "One", "/p1", db_path=self.db_path)
+        song_metadata.add_song("song2222BBBB2222", "Two", "/p2", db_path=self.db_path)
+
+        songs = song_metadata.get_songs(
+            ["song1111AAAA1111", "songNONEABCD5678", "song2222BBBB2222"],
+            self.db_path,
+        )
+        self.assertEqual(set(songs), {"song1111AAAA1111", "song2222BBBB2222"})
+        self.assertEqual(songs["song2222BBBB2222"]["title"], "Two")
+        self.assertEqual(song_metadata.get_songs([], self.db_path), {})
+
     def test_get_all_songs_empty(self):
         """Test getting all songs from empty database"""
         songs = song_metadata.get_all_songs(self.db_path)
@@ -180,6 +196,33 @@ class TestGetSong(TestSongMetadata):
         self.assertEqual(songs[1]["uid"], "song3333CCCC3333")
         self.assertEqual(songs[2]["uid"], "song1111AAAA1111")
 
+    def test_get_songs_by_date(self):
+        """Test date ordering in both directions and the row limit"""
+        for uid, add_date in (
+            ("song1111AAAA1111", "2025-01-01"),
+            ("song2222BBBB2222", "2025-01-03"),
+            ("song3333CCCC3333", "2025-01-02"),
+        ):
+            song_metadata.add_song(
+                uid, uid, "/p", add_date=add_date, db_path=self.db_path
+            )
+
+        newest = song_metadata.get_songs_by_date(db_path=self.db_path)
+        self.assertEqual(
+            [s["uid"] for s in newest],
+            ["song2222BBBB2222", "song3333CCCC3333", "song1111AAAA1111"],
+        )
+        oldest = song_metadata.get_songs_by_date(
+            newest_first=False, limit=2, db_path=self.db_path
+        )
+        self.assertEqual(
+            [s["uid"] for s in oldest], ["song1111AAAA1111", "song3333CCCC3333"]
+        )
+        page_two = song_metadata.get_songs_by_date(
+            limit=2, offset=2, db_path=self.db_path
+        )
+        self.assertEqual([s["uid"] for s in page_two], ["song1111AAAA1111"])
+
 
 class TestSearchSongs(TestSongMetadata):
     """Tests for searching songs"""
@@ -296,6 +339,46 @@ class TestGetSongsAlphabetically(TestSongMetadata):
         titles = [s["title"] for s in songs]
         self.assertEqual(titles, ["Zebra", "Beta", "Alpha"])
 
+    def test_get_songs_alphabetically_cached_until_modified(self):
+        """Test that the list is reused until the library changes"""
+        self._add_alphabetical_test_songs()
+
+        first = song_metadata.get_songs_alphabetically(db_path=self.db_path)
+        second = song_metadata.get_songs_alphabetically(db_path=self.db_path)
+        self.assertIs(first, second)
+
+        song_metadata.update_song_title("song1111AAAA1111", "Aardvark", self.db_path)
+        renamed = song_metadata.get_songs_alphabetically(db_path=self.db_path)
+        self.assertIsNot(renamed, first)
+        self.assertEqual(renamed[0]["title"], "Aardvark")
+
+        song_metadata.delete_song("song2222BBBB2222", self.db_path)
+        titles = [
+            s["title"]
+            for s in song_metadata.get_songs_alphabetically(db_path=self.db_path)
+        ]
+        self.assertEqual(titles, ["Aardvark", "Beta"])
+
+    def test_get_alpha_index_map(self):
+        """Test that UIDs map to 1-based alphabetical positions"""
+        self._add_alphabetical_test_songs()
+
+        index = song_metadata.get_alpha_index_map(db_path=self.db_path)
+        self.assertIs(index, song_metadata.get_alpha_index_map(db_path=self.db_path))
+        songs = song_metadata.get_songs_alphabetically(db_path=self.db_path)
+        self.assertEqual(index, {s["uid"]: i + 1 for i, s in enumerate(songs)})
+
+        song_metadata.delete_song(songs[0]["uid"], self.db_path)
+        index = song_metadata.get_alpha_index_map(db_path=self.db_path)
+        self.assertNotIn(songs[0]["uid"], index)
+        self.assertEqual(index[songs[1]["uid"]], 1)
+
+    def test_library_version_bumped_on_write(self):
+        """Test that every write to the songs table bumps the library version"""
+        before = song_metadata.get_library_version()
+        song_metadata.add_song("song4444DDDD4444", "Gamma", "/p4", db_path=self.db_path)
+        self.assertGreater(song_metadata.get_library_version(), before)
+
 
 class TestGetSongsWithListenCount(TestSongMetadata):
     """Tests for getting songs with listen counts"""
@@ -377,6 +460,17 @@ class TestGetSongsWithListenCount(TestSongMetadata):
         songs = song_metadata.get_songs_with_listen_count(limit=2, db_path=self.db_path)
         self.assertEqual(len(songs), 2)
 
+    def test_get_songs_with_listen_count_includes_buffered(self):
+        """Test that listens not yet flushed are counted"""
+        listen_history.init_database(self.db_path)
+        song_metadata.add_song(
+            "song1111AAAA1111", "Song 1", "/p1", db_path=self.db_path
+        )
+        listen_history.log_listen("song1111AAAA1111", self.db_path)
+
+        songs = song_metadata.get_songs_with_listen_count(db_path=self.db_path)
+        self.assertEqual(songs[0]["listen_count"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()